@@ -208,4 +208,87 @@ def test_sqrt():
     df = tp.tibble(x = [9, 25, 100])
     actual = df.mutate(x = tp.sqrt('x'))
     expected = tp.tibble(x = [3, 5, 10])
-    assert actual.equals(expected), "sqrt failed"
\ No newline at end of file
+    assert actual.equals(expected), "sqrt failed"
+
+def test_read_csv_compact(tmp_path):
+    """Can shrink column types when reading a csv"""
+    path = str(tmp_path / "df.csv")
+    tp.tibble(x = range(3), y = ['a', 'a', 'b']).write_csv(path)
+    actual = tp.read_csv(path, compact = True)
+    assert actual.as_polars().dtypes == [tp.Int8, tp.Utf8], "read_csv compact failed"
+
+def test_read_csv_batched(tmp_path):
+    """Can read a csv in batches"""
+    path = str(tmp_path / "df.csv")
+    tp.tibble(x = range(5), y = ['a', 'a', 'b', 'b', '1']).write_csv(path)
+    batches = list(tp.read_csv_batched(path, batch_size = 2, infer_schema_length = 2))
+    assert [df.nrow for df in batches] == [2, 2, 1], "read_csv_batched batch sizes failed"
+    assert all(type(df) == tp.tibble for df in batches), "read_csv_batched didn't return tibbles"
+    actual = batches[2]
+    expected = tp.tibble(x = [4], y = ['1'])
+    assert actual.equals(expected), "read_csv_batched schema failed"
+
+def test_read_ipc(tmp_path):
+    """Can read and write an ipc file"""
+    path = str(tmp_path / "df.arrow")
+    expected = tp.tibble(x = range(3), y = ['a', 'a', 'b'])
+    expected.write_ipc(path)
+    actual = tp.read_ipc(path)
+    assert type(actual) == tp.tibble, "read_ipc didn't return a tibble"
+    assert actual.equals(expected), "read_ipc failed"
+    assert tp.read_ipc(path, memory_map = False).equals(expected), "read_ipc memory_map = False failed"
+
+def test_scan_csv(tmp_path):
+    """Can lazily read a csv"""
+    path = str(tmp_path / "df.csv")
+    tp.tibble(x = range(3), y = ['a', 'a', 'b']).write_csv(path)
+    actual = tp.scan_csv(path).filter(col('x') < 2).select('y')
+    assert isinstance(actual, tp.LazyTibble), "scan_csv didn't return a LazyTibble"
+    expected = tp.tibble(y = ['a', 'a'])
+    assert actual.collect().equals(expected), "scan_csv failed"
+
+def test_scan_ipc(tmp_path):
+    """Can lazily read an ipc file"""
+    path = str(tmp_path / "df.arrow")
+    tp.tibble(x = range(3), y = ['a', 'a', 'b']).write_ipc(path)
+    actual = tp.scan_ipc(path).filter(col('x') < 2).select('y').collect()
+    expected = tp.tibble(y = ['a', 'a'])
+    assert actual.equals(expected), "scan_ipc failed"
+
+def test_scan_parquet(tmp_path):
+    """Can lazily read a parquet file"""
+    path = str(tmp_path / "df.parquet")
+    tp.tibble(x = range(3), y = ['a', 'a', 'b']).write_parquet(path)
+    actual = tp.scan_parquet(path).filter(col('x') < 2).select('y').collect()
+    expected = tp.tibble(y = ['a', 'a'])
+    assert actual.equals(expected), "scan_parquet failed"
+
+def test_scan_parquet_hive(tmp_path):
+    """Can prune hive partitions"""
+    path = str(tmp_path / "lake")
+    tp.tibble(year = [2025, 2026, 2027], x = range(3)).write_parquet(path, partition_by = 'year')
+    # Only readable if the partition is pruned
+    with open(tmp_path / "lake" / "year=2027" / "00000000.parquet", 'w') as f:
+        f.write("not a parquet file")
+    actual = tp.scan_parquet(path).filter(col('year') == 2026).collect()
+    expected = tp.tibble(year = [2026], x = [1])
+    assert actual.equals(expected), "scan_parquet hive pruning failed"
+    actual = tp.scan_parquet(str(tmp_path / "lake" / "**" / "*.parquet"), hive_partitioning = True)
+    actual = actual.filter(col('year') < 2027).collect()
+    expected = tp.tibble(year = [2025, 2026], x = [0, 1])
+    assert actual.equals(expected), "scan_parquet glob failed"
+
+def test_read_parquet_deferred(tmp_path):
+    """Can prune hive partitions with deferred = True"""
+    path = str(tmp_path / "lake")
+    tp.tibble(year = [2025, 2026], x = range(2)).write_parquet(path, partition_by = 'year')
+    # Only readable if the partition is pruned
+    with open(tmp_path / "lake" / "year=2026" / "00000000.parquet", 'w') as f:
+        f.write("not a parquet file")
+    tp.options(deferred = True)
+    try:
+        actual = tp.read_parquet(path).filter(col('year') == 2025)
+        expected = tp.tibble(year = [2025], x = [0])
+        assert actual.equals(expected), "deferred read_parquet failed"
+    finally:
+        tp.options(deferred = False)
@@ -1,5 +1,7 @@
 import tidypolars as tp
 from tidypolars import col
+import polars as pl
+import pytest
 
 def test_group_filter():
     """Can filter by group"""
@@ -65,4 +67,98 @@ def test_group_summarize_across():
                           'max_x': [1, 2],
                           'max_y': [4, 5],
                           'avg_x': [0.5, 2]})
-    assert actual.equals(expected), "group summarize across failed"
\ No newline at end of file
+    assert actual.equals(expected), "group summarize across failed"
+
+def test_group_mutate_keeps_order():
+    """Group mutate keeps the row order"""
+    df = tp.tibble(x = [3, 1, 2, 5], y = ['a', 'b', 'a', 'b'])
+    actual = df.mutate(max_x = col('x').max(), row_num = tp.row_number(), _by = 'y')
+    expected = tp.tibble(x = [3, 1, 2, 5], y = ['a', 'b', 'a', 'b'],
+                         max_x = [3, 5, 3, 5], row_num = [1, 1, 2, 2])
+    assert actual.equals(expected), "group mutate order failed"
+
+def test_group_mutate_window_error():
+    """Group mutate raises the window error for expressions that don't match the group length"""
+    df = tp.tibble(x = [3, 1, 2, 5], y = ['a', 'b', 'a', 'b'])
+    with pytest.raises(pl.exceptions.ShapeError):
+        df.mutate(first_x = col('x').head(1), _by = 'y')
+
+def test_group_filter_keeps_order():
+    """Group filter keeps the row order"""
+    df = tp.tibble(x = [3, 1, 2, 5, 4], y = ['a', 'b', 'a', 'b', 'c'])
+    actual = df.filter(col('x') == col('x').max(), _by = 'y')
+    expected = tp.tibble(x = [3, 5, 4], y = ['a', 'b', 'c'])
+    assert actual.equals(expected), "group filter order failed"
+
+def test_group_slice_keeps_order():
+    """Group slice returns rows in the requested order or the input order"""
+    df = tp.tibble(x = range(5), y = ['b', 'a', 'b', 'a', 'c'])
+    actual = df.slice(0, -1, _by = 'y', _keep_order = True)
+    expected = tp.tibble(x = range(5), y = ['b', 'a', 'b', 'a', 'c'])
+    assert actual.equals(expected), "group slice order failed"
+    actual = df.slice(1, 0, _by = 'y')
+    expected = tp.tibble(x = [3, 1, 2, 0, 4], y = ['a', 'a', 'b', 'b', 'c'])
+    assert actual.equals(expected), "group slice default order failed"
+    actual = df.slice(-1, _by = 'y', _keep_order = False)
+    expected = tp.tibble(x = [3, 2, 4], y = ['a', 'b', 'c'])
+    assert actual.equals(expected), "group slice sorted order failed"
+    actual = df.slice(2, 0, 0, _by = 'y', _keep_order = False)
+    expected = tp.tibble(x = [1, 1, 0, 0, 4, 4], y = ['a', 'a', 'b', 'b', 'c', 'c'])
+    assert actual.equals(expected), "group slice requested order failed"
+    actual = df.group_by('y').slice(-1, 0, _keep_order = False).ungroup()
+    expected = tp.tibble(x = [3, 1, 2, 0, 4, 4], y = ['a', 'a', 'b', 'b', 'c', 'c'])
+    assert actual.equals(expected), "grouped tibble slice requested order failed"
+
+def test_group_slice_head_tail_keeps_order():
+    """Group slice_head and slice_tail keep the row order"""
+    df = tp.tibble(x = range(5), y = ['b', 'a', 'b', 'a', 'b'])
+    actual = df.slice_head(1, _by = 'y')
+    expected = tp.tibble(x = [0, 1], y = ['b', 'a'])
+    assert actual.equals(expected), "group slice_head order failed"
+    actual = df.slice_tail(2, _by = 'y', _keep_order = False)
+    expected = tp.tibble(x = [1, 3, 2, 4], y = ['a', 'a', 'b', 'b'])
+    assert actual.equals(expected), "group slice_tail sorted order failed"
+
+def test_group_by():
+    """Can chain verbs on a grouped tibble"""
+    df = tp.tibble(x = [3, 1, 2, 5, 4], y = ['a', 'b', 'a', 'b', 'a'])
+    actual = (
+        df.group_by('y')
+        .mutate(max_x = col('x').max())
+        .filter(col('x') < col('max_x'))
+        .slice_head(1)
+        .ungroup()
+    )
+    expected = tp.tibble(x = [3, 1], y = ['a', 'b'], max_x = [4, 5])
+    assert actual.equals(expected), "group_by verbs failed"
+
+def test_group_by_summarize():
+    """Can summarize a grouped tibble"""
+    df = tp.tibble(x = range(3), y = ['a', 'a', 'b'])
+    actual = df.group_by('y').summarize(avg_x = col('x').mean()).arrange('y')
+    expected = tp.tibble(y = ['a', 'b'], avg_x = [0.5, 2])
+    assert actual.equals(expected), "group_by summarize failed"
+
+def test_group_by_group_ids():
+    """Group ids are reused until the group columns change"""
+    df = tp.tibble(x = range(3), y = ['a', 'a', 'b']).group_by('y')
+    out = df.mutate(z = col('x') * 2).filter(col('x') > 0)
+    assert out._group_ids is not None, "group ids weren't reused"
+    out = out.mutate(y = tp.lit('c'))
+    assert out._group_ids is None, "group ids weren't reset"
+    actual = out.mutate(n = tp.n()).ungroup()
+    expected = tp.tibble(x = [1, 2], y = ['c', 'c'], z = [2, 4], n = [2, 2])
+    assert actual.equals(expected), "group ids weren't recomputed"
+
+def test_group_by_group_id_column():
+    """Group verbs keep a column called _group_id"""
+    df = tp.tibble(_group_id = [1, 2], g = ['a', 'a'])
+    actual = df.group_by('g').mutate(n = tp.n()).ungroup()
+    expected = tp.tibble(_group_id = [1, 2], g = ['a', 'a'], n = [2, 2])
+    assert actual.equals(expected), "group_by with _group_id failed"
+    actual = tp.tibble(x = range(2), g = ['a', 'a']).group_by('g').mutate(_group_id = col('x')).mutate(n = tp.n()).ungroup()
+    expected = tp.tibble(x = range(2), g = ['a', 'a'], _group_id = range(2), n = [2, 2])
+    assert actual.equals(expected), "group_by creating _group_id failed"
+    actual = tp.tibble(x = range(2), g = ['a', 'a']).group_by('g').summarize(_group_id = col('x').sum())
+    expected = tp.tibble(g = ['a'], _group_id = [1])
+    assert actual.equals(expected), "group_by summarize creating _group_id failed"
@@ -0,0 +1,156 @@
+import tidypolars as tp
+from tidypolars import col
+import polars as pl
+import pytest
+
+def test_lazy():
+    """Can convert to a LazyTibble and back"""
+    df = tp.tibble(x = range(3), y = ['a', 'a', 'b'])
+    lazy_df = df.lazy()
+    assert isinstance(lazy_df, tp.LazyTibble), "lazy didn't return a LazyTibble"
+    actual = lazy_df.collect()
+    assert actual.equals(df), "collect failed"
+    assert type(actual) == tp.tibble, "collect didn't return a tibble"
+
+def test_lazy_from_polars():
+    """from_polars converts a LazyFrame to a LazyTibble"""
+    lazy_df = tp.from_polars(pl.LazyFrame({'x': range(3)}))
+    assert isinstance(lazy_df, tp.LazyTibble), "from_polars didn't return a LazyTibble"
+
+def test_lazy_verbs():
+    """Can chain verbs on a LazyTibble"""
+    df = tp.tibble(x = range(4), y = ['a', 'a', 'b', 'b'], z = range(4))
+    actual = (
+        df.lazy()
+        .filter(col('x') < 3)
+        .mutate(double_x = col('x') * 2)
+        .select('x', 'double_x', 'y')
+        .arrange(tp.desc('x'))
+    )
+    assert isinstance(actual, tp.LazyTibble), "verbs didn't return a LazyTibble"
+    expected = tp.tibble(x = [2, 1, 0], double_x = [4, 2, 0], y = ['b', 'a', 'a'])
+    assert actual.collect().equals(expected), "lazy verbs failed"
+
+def test_lazy_names():
+    """Can get names of a LazyTibble"""
+    df = tp.tibble(x = range(3), y = range(3)).lazy()
+    assert df.names == ['x', 'y'], "lazy names failed"
+    assert df.ncol == 2, "lazy ncol failed"
+
+def test_lazy_summarize():
+    """Can summarize by group on a LazyTibble"""
+    df = tp.tibble(x = range(3), y = ['a', 'a', 'b']).lazy()
+    actual = df.summarize(avg_x = col('x').mean(), _by = 'y').arrange('y').collect()
+    expected = tp.tibble(y = ['a', 'b'], avg_x = [0.5, 2])
+    assert actual.equals(expected), "lazy summarize failed"
+
+def test_lazy_group_mutate():
+    """Can mutate by group on a LazyTibble"""
+    df = tp.tibble(x = range(2), y = ['a', 'b']).lazy()
+    actual = df.mutate(avg_x = col('x').mean(), _by = 'y').arrange('y').collect()
+    expected = tp.tibble(x = [0, 1], y = ['a', 'b'], avg_x = [0.0, 1.0])
+    assert actual.equals(expected), "lazy group mutate failed"
+
+def test_lazy_left_join():
+    """Can join a tibble onto a LazyTibble"""
+    df1 = tp.tibble(x = ['a', 'a', 'b'], y = range(3)).lazy()
+    df2 = tp.tibble(x = ['a', 'b'], z = range(2))
+    actual = df1.left_join(df2).collect()
+    expected = tp.tibble(x = ['a', 'a', 'b'], y = range(3), z = [0, 0, 1])
+    assert actual.equals(expected), "lazy left_join failed"
+
+def test_lazy_separate():
+    """Can separate on a LazyTibble"""
+    df = tp.tibble(x = ['a_a', 'b_b', 'c_c'])
+    actual = df.lazy().separate('x', into = ['left', 'right'])
+    assert isinstance(actual, tp.LazyTibble), "lazy separate didn't return a LazyTibble"
+    expected = tp.tibble(left = ['a', 'b', 'c'], right = ['a', 'b', 'c'])
+    assert actual.collect().equals(expected), "lazy separate failed"
+
+def test_lazy_hidden_methods():
+    """Polars methods and eager verbs aren't available on a LazyTibble"""
+    lazy_df = tp.tibble(x = range(3), y = ['a', 'a', 'b']).lazy()
+    for method in ['bind_cols', 'group_by', 'pivot_wider', 'pull']:
+        with pytest.raises(TypeError, match = 'collect'):
+            getattr(lazy_df, method)('x')
+    with pytest.raises(AttributeError):
+        lazy_df.sort('x')
+
+def test_select_names():
+    """Can resolve column selections on a LazyTibble"""
+    df = tp.tibble(a = range(3), b = range(3), c = ['a', 'a', 'b'])
+    lazy_df = df.lazy()
+    assert lazy_df.drop(tp.Int64).names == ['c'], "lazy drop failed"
+    assert lazy_df.relocate(tp.ends_with('c'), _after = 'a').names == ['a', 'c', 'b'], "lazy relocate failed"
+    actual = lazy_df.unite("united", ['c', tp.col('a')]).collect()
+    expected = tp.tibble(b = range(3), united = ['a_0', 'a_1', 'b_2'])
+    assert actual.equals(expected), "lazy unite failed"
+
+def test_deferred():
+    """Verbs are collected on first use with deferred = True"""
+    tp.options(deferred = True)
+    try:
+        df = tp.tibble(x = range(4), y = ['a', 'b', 'a', 'b'])
+        actual = df.filter(col('x') > 0).mutate(z = col('x') * 2).select('y', 'z')
+        assert type(actual) == tp.tibble, "deferred verbs didn't return a tibble"
+        assert '_pending' in actual.__dict__, "deferred verbs were collected early"
+        assert (actual.names == ['y', 'z']) & (actual.ncol == 2), "deferred names failed"
+        assert '_pending' in actual.__dict__, "deferred names collected the data"
+        expected = tp.tibble(y = ['b', 'a', 'b'], z = [2, 4, 6])
+        assert actual.equals(expected), "deferred verbs failed"
+        assert actual.nrow == 3, "deferred nrow failed"
+        failed = df.mutate(z = col('nope') + 1)
+        for _ in range(2):
+            with pytest.raises(pl.exceptions.ColumnNotFoundError):
+                failed.nrow
+    finally:
+        tp.options(deferred = False)
+
+def test_options():
+    """Can set options"""
+    assert tp.options()['deferred'] == False, "deferred should default to False"
+    assert tp.options(deferred = True)['deferred'] == True, "can't set deferred"
+    tp.options(deferred = False)
+
+def test_collect_streaming():
+    """Can collect with the streaming engine"""
+    df = tp.tibble(x = range(3), y = ['a', 'a', 'b'])
+    actual = df.lazy().filter(col('x') < 2).collect(streaming = True)
+    expected = tp.tibble(x = range(2), y = ['a', 'a'])
+    assert actual.equals(expected), "streaming collect failed"
+
+def test_sink(tmp_path):
+    """Can sink a LazyTibble to a file"""
+    df = tp.tibble(x = range(3), y = ['a', 'a', 'b'])
+    lazy_df = df.lazy().filter(col('x') < 2)
+    expected = tp.tibble(x = range(2), y = ['a', 'a'])
+    lazy_df.sink_csv(tmp_path / "df.csv")
+    assert tp.read_csv(tmp_path / "df.csv").equals(expected), "sink_csv failed"
+    lazy_df.sink_ipc(tmp_path / "df.arrow")
+    assert tp.scan_ipc(tmp_path / "df.arrow").collect().equals(expected), "sink_ipc failed"
+    lazy_df.sink_parquet(tmp_path / "df.parquet")
+    assert tp.read_parquet(tmp_path / "df.parquet").equals(expected), "sink_parquet failed"
+    lazy_df.sink_parquet(tmp_path / "lake", partition_by = 'y')
+    assert (tmp_path / "lake" / "y=a").is_dir(), "sink_parquet partition_by failed"
+
+def test_explain():
+    """Can label query plan nodes with verbs"""
+    df = tp.tibble(x = range(3), y = ['a', 'a', 'b'])
+    lazy_df = df.lazy().filter(col('x') < 2).mutate(z = col('x') * 2).arrange('z')
+    plan = lazy_df.explain(optimized = False)
+    assert "step 1: filter" in plan, "explain didn't label filter"
+    assert "step 2: mutate" in plan, "explain didn't label mutate"
+    assert "step 3: arrange" in plan, "explain didn't label arrange"
+    assert "step 3: arrange" in lazy_df.explain(), "optimized explain failed"
+    lazy_df.relocate()
+    lazy_df.fill()
+    assert [step.name for step in lazy_df._steps] == ['source', 'filter', 'mutate', 'arrange'], "verbs returning self changed the steps"
+
+def test_profile():
+    """Can profile each verb of a LazyTibble"""
+    df = tp.tibble(x = range(3), y = ['a', 'a', 'b'])
+    actual, timings = df.lazy().filter(col('x') < 2).mutate(z = col('x') * 2).profile()
+    expected = tp.tibble(x = range(2), y = ['a', 'a'], z = [0, 2])
+    assert actual.equals(expected), "profile results failed"
+    expected_timings = tp.tibble(verb = ['source', 'filter', 'mutate', 'optimized plan'], rows = [3, 2, 2, 2])
+    assert timings.select('verb', 'rows').equals(expected_timings), "profile timings failed"
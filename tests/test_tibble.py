@@ -1,7 +1,8 @@
 import tidypolars as tp
 from tidypolars import col
 import polars as pl
-from tidypolars.utils import _repeat
+import pytest
+from tidypolars.utils import _mutate_batches, _repeat
 
 def test_arrange1():
     """Can arrange ascending"""
@@ -28,6 +29,23 @@ def test_arrange_across():
     expected = tp.tibble(x = ['a', 'a', 'b'], y = [2, 1, 3], z = [2, 1, 3])
     assert actual.equals(expected), "arrange across failed"
 
+def test_asof_join():
+    """Can perform an as-of join"""
+    df1 = tp.tibble(time = [5, 1, 3, 0], g = ['a', 'a', 'b', 'a'])
+    df2 = tp.tibble(time = [0, 2, 4, 2], g = ['a', 'b', 'a', 'a'], value = range(4))
+    actual = df1.asof_join(df2, on = 'time', by = 'g')
+    expected = tp.tibble(time = [5, 1, 3, 0], g = ['a', 'a', 'b', 'a'], value = [2, 0, 1, 0])
+    assert actual.equals(expected), "asof_join backward failed"
+    actual = df1.asof_join(df2, on = 'time', by = 'g', strategy = 'forward')
+    expected = tp.tibble(time = [5, 1, 3, 0], g = ['a', 'a', 'b', 'a'], value = [None, 3, None, 0])
+    assert actual.equals(expected), "asof_join forward failed"
+    actual = df1.asof_join(df2.select('time', 'value'), on = 'time', strategy = 'nearest', tolerance = 0)
+    expected = tp.tibble(time = [5, 1, 3, 0], g = ['a', 'a', 'b', 'a'], value = [None, None, None, 0])
+    assert actual.equals(expected), "asof_join tolerance failed"
+    df1 = df1.mutate(_row_index = col('time'))
+    actual = df1.asof_join(df2, on = 'time', by = 'g')
+    assert actual.pull('_row_index').to_list() == [5, 1, 3, 0], "asof_join kept column failed"
+
 def test_bind_cols_single():
     """Can bind_cols"""
     df1 = tp.tibble({'x': ['a', 'a', 'b'], 'y': [1, 2, 3]})
@@ -72,11 +90,80 @@ def test_bind_rows_multiple():
     expected = tp.tibble({'x': ['a', 'a', 'b', 'b'], 'y': [2, 1, 3, 3]})
     assert actual.equals(expected), "bind_rows multiple failed"
 
+def test_as_pandas_arrow_dtypes():
+    """Can convert to and from pandas with arrow dtypes"""
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    df = tp.tibble(x = range(3), y = ['a', 'a', 'b'])
+    pd_df = df.as_pandas(arrow_dtypes = True)
+    assert str(pd_df['y'].dtype).endswith('[pyarrow]'), "as_pandas arrow_dtypes failed"
+    actual = tp.from_pandas(pd_df)
+    assert actual.equals(df), "from_pandas arrow dtypes failed"
+    assert type(actual) == tp.tibble, "from_pandas didn't return a tibble"
+
+def test_arrow_c_stream():
+    """Can export and import with the Arrow PyCapsule Interface"""
+    class ArrowStream():
+        def __init__(self, df):
+            self.df = df
+        def __arrow_c_stream__(self, requested_schema = None):
+            return self.df.__arrow_c_stream__(requested_schema)
+    df = tp.tibble(x = range(3), y = ['a', 'a', 'b'])
+    actual = tp.as_tibble(ArrowStream(df))
+    assert type(actual) == tp.tibble, "as_tibble didn't return a tibble"
+    assert actual.equals(df), "arrow c stream failed"
+
+def test_builder():
+    """Can accumulate frames with a TibbleBuilder"""
+    builder = tp.TibbleBuilder()
+    for i in range(3):
+        builder.append(tp.tibble(x = [i], y = ['a']))
+    builder.append({'x': [3]})
+    actual = builder.finish()
+    expected = tp.tibble(x = range(4), y = ['a', 'a', 'a', None])
+    assert actual.equals(expected), "TibbleBuilder failed"
+    assert type(actual) == tp.tibble, "TibbleBuilder didn't return a tibble"
+    builder = tp.TibbleBuilder()
+    builder.extend([tp.tibble(x = [1]), tp.tibble(x = [1.5])])
+    assert builder.finish().equals(tp.tibble(x = [1.0, 1.5])), "TibbleBuilder mixed types failed"
+
+def test_builder_spill(tmp_path):
+    """Can spill a TibbleBuilder to disk"""
+    builder = tp.TibbleBuilder(memory_limit = 1, spill_dir = tmp_path)
+    builder.extend(tp.tibble(x = [i]) for i in range(3))
+    assert len(list(tmp_path.iterdir())) == 3, "TibbleBuilder didn't spill"
+    actual = builder.finish()
+    expected = tp.tibble(x = range(3))
+    assert actual.equals(expected), "TibbleBuilder spill failed"
+    assert len(list(tmp_path.iterdir())) == 0, "TibbleBuilder didn't remove spilled files"
+    builder = tp.TibbleBuilder(memory_limit = 1, spill_dir = tmp_path)
+    builder.extend([tp.tibble(x = [1]), tp.tibble(x = [1.5])])
+    builder.append(tp.tibble(x = [2], y = ['a']))
+    actual = builder.finish()
+    expected = tp.tibble(x = [1.0, 1.5, 2.0], y = [None, None, 'a'])
+    assert actual.equals(expected), "TibbleBuilder spill mixed types failed"
+
 def test_clone():
     df = tp.tibble(x = range(3), y = range(3))
     actual = df.clone()
     assert type(actual) == tp.tibble, "clone didn't return a tibble"
 
+def test_compact():
+    """Can shrink column types"""
+    df = tp.tibble(x = range(3), y = [1.5, 2.5, None], z = [0.1, 0.2, 0.3], w = ['long string value'] * 3)
+    actual, report = df.compact(report = True)
+    expected = [pl.Int8, pl.Float32, pl.Float64, pl.Categorical]
+    assert actual.as_polars().dtypes == expected, "compact types failed"
+    restored = actual.mutate(x = col('x').cast(pl.Int64), y = col('y').cast(pl.Float64), w = col('w').cast(pl.Utf8))
+    assert restored.equals(df), "compact changed values"
+    assert report.pull('column').to_list() == ['x', 'y', 'w'], "compact report failed"
+    assert (report.pull('bytes_saved') > 0).all(), "compact didn't save memory"
+    df = tp.tibble(x = pl.Series([1, 2], dtype = pl.Int128), y = range(2))
+    assert df.compact().as_polars().dtypes == [pl.Int128, pl.Int8], "compact with Int128 failed"
+    df = tp.tibble(x = [0, 200], n = [-1, 5], u = pl.Series([0, 200], dtype = pl.UInt64))
+    assert df.compact().as_polars().dtypes == [pl.Int16, pl.Int8, pl.UInt8], "compact changed signedness"
+    assert df.compact().mutate(x = col('x') - 1).pull('x').to_list() == [-1, 199], "compact signed arithmetic failed"
+
 def test_count_no_args():
     """Can count rows (no args)"""
     df = tp.tibble({'x': ['a', 'a', 'b'], 'y': [1, 1, 1]})
@@ -161,6 +248,48 @@ def test_full_join():
     assert actual.equals(expected, null_equal = True), "full_join failed"
     assert type(actual) == tp.tibble, "full_join didn't return a tibble"
 
+def test_inequality_join():
+    """Can perform an inequality join"""
+    df1 = tp.tibble(id = range(4), time = [1, 5, 9, 50])
+    df2 = tp.tibble(id = [10, 11], start = [0, 4], end = [5, 10])
+    actual = df1.inequality_join(df2, col('time') >= col('start'), col('time') < col('end')).arrange('id')
+    expected = tp.tibble(id = range(3), time = [1, 5, 9], id_right = [10, 11, 11], start = [0, 4, 4], end = [5, 10, 10])
+    assert actual.equals(expected), "inequality_join failed"
+    actual = df1.inequality_join(df2, col('time') >= col('start'), col('time') < col('end'), how = 'left').arrange('id')
+    assert actual.pull('id_right').to_list() == [10, 11, 11, None], "inequality_join how = 'left' failed"
+
+def test_join_all():
+    """Can perform several joins in one plan"""
+    df1 = tp.tibble(x = ['a', 'a', 'b', 'c'], y = range(4))
+    df2 = tp.tibble(x = ['a', 'b', 'c'], z = range(3))
+    df3 = tp.tibble(y = [0, 0, 1, 2, 3], w = range(5))
+    df4 = tp.tibble(x = ['a', 'b'])
+    actual = df1.join_all([
+        dict(df = df3, on = 'y'),
+        dict(df = df2, how = 'left'),
+        dict(df = df4, how = 'semi')
+    ]).arrange('y', 'w')
+    expected = df1.inner_join(df3, on = 'y').left_join(df2).semi_join(df4).arrange('y', 'w')
+    assert actual.equals(expected), "join_all failed"
+    actual = df1.lazy().join_all([df2, df4]).collect().arrange('y')
+    expected = df1.inner_join(df2).inner_join(df4).arrange('y')
+    assert actual.equals(expected), "join_all lazy failed"
+    sales = tp.tibble(pid = [0, 0, 1, 1], sid = [10, 20, 10, 20], amt = range(4))
+    d1 = tp.tibble(pid = [0, 0, 1, 1], v = [1, 2, 3, 4])
+    d2 = tp.tibble(sid = [10], v = [100])
+    actual = sales.join_all([dict(df = d1, on = 'pid'), dict(df = d2, on = 'sid')]).arrange('amt', 'v')
+    expected = sales.inner_join(d1, on = 'pid').inner_join(d2, on = 'sid').arrange('amt', 'v')
+    assert actual.equals(expected), "join_all with repeated column names failed"
+    lazy_df = df1.lazy().filter(col('y') > 0).join_all([df2])
+    assert [step.name for step in lazy_df._steps] == ['source', 'filter', 'join_all'], "join_all steps failed"
+    tp.options(deferred = True)
+    try:
+        actual = df1.join_all([df2, df4])
+        assert '_pending' in actual.__dict__, "deferred join_all was collected early"
+        assert actual.arrange('y').equals(df1.inner_join(df2).inner_join(df4).arrange('y')), "deferred join_all failed"
+    finally:
+        tp.options(deferred = False)
+
 def test_inner_join():
     """Can perform a inner join"""
     df1 = tp.tibble(x = ['a', 'a', 'b'], y = range(3))
@@ -170,6 +299,36 @@ def test_inner_join():
     assert actual.equals(expected), "inner_join failed"
     assert type(actual) == tp.tibble, "inner_join didn't return a tibble"
 
+def test_semi_join():
+    """Can perform a semi join"""
+    df1 = tp.tibble(x = ['a', 'a', 'b'], y = range(3))
+    df2 = tp.tibble(x = ['a', 'a'], z = range(2))
+    actual = df1.semi_join(df2)
+    expected = tp.tibble(x = ['a', 'a'], y = [0, 1])
+    assert actual.equals(expected), "semi_join failed"
+
+def test_anti_join():
+    """Can perform an anti join"""
+    df1 = tp.tibble(x = ['a', 'a', 'b'], y = range(3))
+    df2 = tp.tibble(z = ['a', 'a'])
+    actual = df1.anti_join(df2, left_on = 'x', right_on = 'z')
+    expected = tp.tibble(x = ['b'], y = [2])
+    assert actual.equals(expected), "anti_join failed"
+
+def test_keyed_join():
+    """Can join a keyed tibble"""
+    df1 = tp.tibble(x = [2, 0, None, 3], y = range(4))
+    df2 = tp.tibble(x = [3, 1, 2], y = [0, 1, 2], z = ['c', 'a', 'b'])
+    keyed = df2.set_key('x')
+    assert keyed.key == ['x'], "set_key failed"
+    actual = df1.left_join(keyed, on = 'x')
+    expected = df1.left_join(df2, on = 'x')
+    assert actual.equals(expected), "keyed left_join failed"
+    actual = df1.inner_join(keyed, on = 'x')
+    expected = df1.inner_join(df2, on = 'x')
+    assert actual.equals(expected), "keyed inner_join failed"
+    assert keyed.filter(col('x') > 1).key == None, "verbs should drop the key"
+
 def test_left_join():
     """Can perform a left join"""
     df1 = tp.tibble(x = ['a', 'a', 'b'], y = range(3))
@@ -217,6 +376,25 @@ def test_mutate_constant():
     )
     assert actual.equals(expected), "mutate failed"
 
+def test_mutate_batches():
+    """Independent mutate expressions are batched together"""
+    exprs = [
+        (col('x') * 2).alias('double_x'),
+        (col('y') + 1).alias('y'),
+        (col('y') * 2).alias('double_y'),
+        (col('double_x') + 1).alias('z'),
+        (col('x') + 1).alias('y')
+    ]
+    actual = [len(batch) for batch in _mutate_batches(exprs)]
+    assert actual == [2, 3], "mutate batches failed"
+
+def test_mutate_sequential():
+    """Can use columns created earlier in the same mutate"""
+    df = tp.tibble(x = range(3))
+    actual = df.mutate(y = col('x') + 1, x = col('y') * 2, z = col('x') + col('y'))
+    expected = tp.tibble(x = [2, 4, 6], y = [1, 2, 3], z = [3, 6, 9])
+    assert actual.equals(expected), "sequential mutate failed"
+
 def test_names():
     """Can get column names"""
     df = tp.tibble({'x': _repeat(1, 3), 'y': _repeat(2, 3)})
@@ -467,3 +645,12 @@ def test_conversion():
     assert actual.equals(expected), "as_polars failed"
     assert tp.is_tibble(df) == True, "is_tibble failed"
     assert tp.as_tibble(actual).equals(df), "as_tibble failed"
+
+def test_write_parquet_partitioned(tmp_path):
+    """Can write a hive partitioned parquet dataset"""
+    df = tp.tibble(year = [2025, 2025, 2026], month = [1, 2, 1], x = range(3))
+    path = tmp_path / "lake"
+    df.write_parquet(str(path), partition_by = ['year', 'month'], row_group_size = 1)
+    assert (path / "year=2025" / "month=2").is_dir(), "write_parquet didn't partition"
+    actual = tp.read_parquet(str(path)).arrange('x')
+    assert actual.equals(df), "write_parquet partition_by failed"
@@ -5,6 +5,7 @@ try:
 except:
     __version__ = ""
 
+from .config import *
 from .funs import *
 from .lubridate import *
 from .reexports import *
@@ -13,6 +14,7 @@ from .tibble_df import *
 from .tidyselect import *
 
 __all__ = (
+    config.__all__ +
     funs.__all__ +
     lubridate.__all__ +
     reexports.__all__ +
@@ -0,0 +1,33 @@
+__all__ = ["options"]
+
+_options = {
+    'deferred': False
+}
+
+def options(**kwargs):
+    """
+    Set global tidypolars options
+
+    Parameters
+    ----------
+    deferred : bool
+        If True, tibble verbs are added to a pending polars query plan
+        instead of being run immediately. The plan is optimized and run as a whole
+        the first time the data is used (e.g. printing, `.pull()`, `.nrow`, writing).
+        Defaults to False.
+
+    Returns
+    -------
+    dict
+        The current options
+
+    Examples
+    --------
+    >>> tp.options(deferred = True)
+    >>> df.filter(col('x') > 1).mutate(y = col('x') * 2).select('y') # Not run yet
+    """
+    for key, value in kwargs.items():
+        if key not in _options:
+            raise ValueError(f"Unknown option: {key}")
+        _options[key] = value
+    return _options.copy()
@@ -1,5 +1,8 @@
 import polars as pl
-from .tibble_df import from_polars, tibble
+import inspect
+from operator import not_
+from .config import _options
+from .tibble_df import _deferred_tibble, from_polars, tibble
 from .utils import (
     _as_list,
     _col_expr,
@@ -22,7 +25,8 @@ __all__ = [
     "if_else",
     "lag", "lead",
     "log", "log10",
-    "read_csv", "read_parquet",
+    "read_csv", "read_csv_batched", "read_ipc", "read_parquet",
+    "scan_csv", "scan_ipc", "scan_parquet",
     "rep",
     "replace_null",
     "round",
@@ -714,15 +718,128 @@ def quantile(x, quantile = .5):
 
 def read_csv(file: str,
              *args,
+             compact = False,
              **kwargs):
-    """Simple wrapper around polars.read_csv"""
-    return pl.read_csv(file, *args, **kwargs).pipe(from_polars)
+    """
+    Simple wrapper around polars.read_csv
+
+    With `tp.options(deferred = True)` the file is scanned lazily,
+    so later `.select()` and `.filter()` calls are pushed down into the reader.
+    Use `compact = True` to shrink the column types with `.compact()`.
+    """
+    if _options['deferred'] & not_(compact) & (len(args) == 0) & kwargs.keys().isdisjoint(['columns', 'use_pyarrow']):
+        return _deferred_tibble(scan_csv(file, **kwargs))
+    return _compact_read(pl.read_csv(file, *args, **kwargs), compact)
+
+def read_csv_batched(source: str,
+                     *args,
+                     batch_size = 50000,
+                     **kwargs):
+    """
+    Read a csv file in batches
+
+    The schema is inferred once and used for every batch,
+    so only one batch is held in memory at a time.
+
+    Parameters
+    ----------
+    source : str
+        Path to the file
+    batch_size : int
+        Number of rows in each batch
+    *args, **kwargs :
+        Passed on to `polars.scan_csv()`
+
+    Returns
+    -------
+    An iterator of tibbles
+
+    Examples
+    --------
+    >>> builder = tp.TibbleBuilder()
+    >>> for df in tp.read_csv_batched("data.csv", batch_size = 100000):
+    ...     builder.append(df.filter(col('x') > 1).select('x', 'y'))
+    >>> df = builder.finish()
+    """
+    if 'schema' not in kwargs:
+        kwargs['schema'] = pl.scan_csv(source, *args, **kwargs).collect_schema()
+    batches = pl.scan_csv(source, *args, **kwargs).collect_batches(chunk_size = batch_size)
+    for df in batches:
+        yield df.pipe(from_polars)
+
+def _compact_read(df, compact):
+    """Convert the output of a reader to a tibble and optionally shrink its types"""
+    df = df.pipe(from_polars)
+    if compact:
+        df = df.compact()
+    return df
+
+# polars 2.0 removed `memory_map` from `read_ipc()`
+_read_ipc_has_memory_map = 'memory_map' in inspect.signature(pl.read_ipc).parameters
+
+def read_ipc(source: str,
+             *args,
+             memory_map = True,
+             compact = False,
+             **kwargs):
+    """
+    Read an Arrow IPC (Feather v2) file into a tibble
+
+    Uncompressed files are memory mapped, so opening a large file is nearly instant
+    and the data is paged in from disk as it is used.
+
+    Parameters
+    ----------
+    source : str
+        Path to the file
+    memory_map : bool
+        Memory map the file. Only used by polars 1.x,
+        polars 2.0 memory maps uncompressed files automatically.
+    compact : bool
+        Shrink the column types with `.compact()`
+    *args, **kwargs :
+        Passed on to `polars.read_ipc()`
+
+    Examples
+    --------
+    >>> tp.read_ipc("data.arrow")
+    """
+    eager_only = ['columns', 'use_pyarrow']
+    if _options['deferred'] & not_(compact) & (len(args) == 0) & kwargs.keys().isdisjoint(eager_only):
+        return _deferred_tibble(scan_ipc(source, **kwargs))
+    if _read_ipc_has_memory_map:
+        kwargs['memory_map'] = memory_map
+    return _compact_read(pl.read_ipc(source, *args, **kwargs), compact)
 
 def read_parquet(source: str,
                  *args,
+                 compact = False,
                  **kwargs):
-    """Simple wrapper around polars.read_parquet"""
-    return pl.read_parquet(source, *args, **kwargs).pipe(from_polars)
+    """
+    Read parquet files into a tibble
+
+    With `tp.options(deferred = True)` the files are scanned lazily,
+    so a later `.filter()` on partition keys skips the partitions that don't match
+    and `.select()` only reads the used columns.
+
+    Parameters
+    ----------
+    source : str, list
+        A file, a directory, a glob pattern like `"data/**/*.parquet"`, or a list of files.
+        Partition keys of hive partitioned directories (`year=2026/month=1/...`) are added as columns.
+    compact : bool
+        Shrink the column types with `.compact()`
+    *args, **kwargs :
+        Passed on to `polars.read_parquet()`
+
+    Examples
+    --------
+    >>> tp.read_parquet("data/**/*.parquet")
+    """
+    eager_only = ['columns', 'memory_map', 'pyarrow_options', 'use_pyarrow']
+    if _options['deferred'] & not_(compact) & (len(args) == 0) & kwargs.keys().isdisjoint(eager_only):
+        return _deferred_tibble(scan_parquet(source, **kwargs))
+    return _compact_read(pl.read_parquet(source, *args, **kwargs), compact)
 
 def rep(x, times = 1):
     """
@@ -801,6 +918,78 @@ def row_number():
     """
     return pl.int_range(0, pl.len()) + 1
 
+def scan_csv(source: str,
+             *args,
+             **kwargs):
+    """
+    Lazily read a csv file into a LazyTibble
+
+    Columns and rows are only read when the LazyTibble is collected,
+    so later `.select()` and `.filter()` calls are pushed down into the reader.
+
+    Parameters
+    ----------
+    source : str
+        Path to the file
+    *args, **kwargs :
+        Passed on to `polars.scan_csv()`
+
+    Examples
+    --------
+    >>> tp.scan_csv("data.csv").filter(col('x') > 1).select('x', 'y').collect()
+    """
+    return pl.scan_csv(source, *args, **kwargs).pipe(from_polars)
+
+def scan_ipc(source: str,
+             *args,
+             **kwargs):
+    """
+    Lazily read Arrow IPC (Feather v2) files into a LazyTibble
+
+    Columns and rows are only read when the LazyTibble is collected,
+    so later `.select()` and `.filter()` calls are pushed down into the reader.
+
+    Parameters
+    ----------
+    source : str, list
+        A file, a directory, a glob pattern like `"data/**/*.arrow"`, or a list of files.
+        Partition keys of hive partitioned directories (`year=2026/month=1/...`) are added as columns,
+        and filters on them skip the partitions that don't match.
+    *args, **kwargs :
+        Passed on to `polars.scan_ipc()`
+
+    Examples
+    --------
+    >>> tp.scan_ipc("data.arrow").filter(col('x') > 1).select('x', 'y').collect()
+    """
+    return pl.scan_ipc(source, *args, **kwargs).pipe(from_polars)
+
+def scan_parquet(source: str,
+                 *args,
+                 **kwargs):
+    """
+    Lazily read parquet files into a LazyTibble
+
+    Columns and row groups are only read when the LazyTibble is collected,
+    so later `.select()` and `.filter()` calls are pushed down into the reader.
+    The files are read in parallel.
+
+    Parameters
+    ----------
+    source : str, list
+        A file, a directory, a glob pattern like `"data/**/*.parquet"`, or a list of files.
+        Partition keys of hive partitioned directories (`year=2026/month=1/...`) are added as columns,
+        and filters on them skip the partitions that don't match.
+    *args, **kwargs :
+        Passed on to `polars.scan_parquet()`
+
+    Examples
+    --------
+    >>> tp.scan_parquet("data.parquet").filter(col('x') > 1).select('x', 'y').collect()
+    >>> tp.scan_parquet("lake/").filter(col('year') == 2026).collect()
+    """
+    return pl.scan_parquet(source, *args, **kwargs).pipe(from_polars)
+
 def sd(x):
     """
     Get column standard deviation
@@ -4,26 +4,222 @@ from .utils import (
     _as_list,
     _col_expr,
     _col_exprs,
+    _compact_types,
     _is_expr,
+    _is_sorted,
     _is_string,
+    _filter_group_rows,
+    _gather_group_rows,
+    _group_ids,
     _kwargs_as_exprs,
+    _match_frame_type,
     _mutate_cols,
+    _mutate_cols_by,
+    _names,
+    _select_names,
+    _unused_name,
     _uses_by
 )
+from .config import _options
 from .stringr import str_c
 import copy
 from .reexports import *
 from .tidyselect import everything
 from operator import not_
+from collections import Counter, namedtuple
+import os
+import tempfile
+import time
 
 __all__ = [
     "as_tibble",
     "is_tibble",
     "tibble",
+    "LazyTibble",
+    "GroupedTibble",
+    "TibbleBuilder",
     "desc",
     "from_pandas", "from_polars"
 ]
 
+_Step = namedtuple('_Step', ['name', 'verb', 'args', 'kwargs', 'plan'])
+
+def _verb(verb):
+    """
+    Wrap a verb shared by tibble and LazyTibble
+
+    * With `tp.options(deferred = True)` tibble verbs are added to a pending query plan
+    * Verbs called on a LazyTibble are recorded for `.explain()` and `.profile()`
+    """
+    @ft.wraps(verb)
+    def wrapper(self, *args, **kwargs):
+        if isinstance(self, tibble):
+            if _options['deferred']:
+                return _deferred_tibble(verb(self.lazy(), *args, **kwargs))
+            return verb(self, *args, **kwargs)
+        out = verb(self, *args, **kwargs)
+        if out is self:
+            # Verbs called without arguments return the input, which shouldn't get the new step
+            out = out.as_polars().pipe(from_polars)
+        steps = self._steps
+        if len(steps) == 0:
+            steps = [_Step('source', None, (), {}, self.as_polars())]
+        out._steps = steps + [_Step(verb.__name__, verb, args, kwargs, out.as_polars())]
+        return out
+    return wrapper
+
+def _deferred_tibble(df):
+    """Create a tibble from a LazyTibble that is only collected when its data is used"""
+    out = tibble.__new__(tibble)
+    out.__dict__['_pending'] = df.as_polars()
+    return out
+
+def _collect_pending(df):
+    """Run the pending query plan of a deferred tibble"""
+    attrs = df.__dict__
+    if '_pending' in attrs:
+        # Keep the plan if it fails, so the next access raises the same error
+        attrs['_df'] = attrs['_pending'].collect()._df
+        del attrs['_pending']
+
+class _PendingData():
+    """
+    Collect deferred tibbles the first time their data is used
+
+    Only looked up when `_df` is missing from the instance, so regular tibbles don't pay for it
+    """
+    def __get__(self, obj, objtype = None):
+        if obj is None:
+            return self
+        _collect_pending(obj)
+        try:
+            return obj.__dict__['_df']
+        except KeyError:
+            raise AttributeError('_df') from None
+
+class _HiddenMethod():
+    """Hide a polars method of `base` on tibbles and LazyTibbles"""
+    def __init__(self, name, base = pl.DataFrame):
+        self.name = name
+        self.base = base
+
+    def __get__(self, obj, objtype = None):
+        if obj is None:
+            return getattr(self.base, self.name)
+        raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{self.name}'")
+
+class _EagerMethod():
+    """A tibble method that can't be used on LazyTibbles because it needs the data in memory"""
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, objtype = None):
+        if obj is None:
+            return getattr(tibble, self.name)
+        def method(*args, **kwargs):
+            raise TypeError(
+                f"`.{self.name}()` needs the data in memory and can't be used on a LazyTibble. "
+                "Call `.collect()` first."
+            )
+        return method
+
+def _step_nodes(steps):
+    """Get the query plan nodes added by each step"""
+    nodes = []
+    previous = Counter()
+    for step in steps:
+        current = Counter(line.strip() for line in step.plan.explain(optimized = False).split('\n'))
+        nodes.append(set(current - previous))
+        previous = current
+    return nodes
+
+def _join_specs(df, joins):
+    """
+    Convert the joins passed to `.join_all()` to dicts with explicit join columns.
+    Joins without join columns use the columns in common at that point of the written order.
+    """
+    specs = []
+    names = _names(df)
+    plan = df.lazy()
+    for join in joins:
+        if not_(isinstance(join, dict)):
+            join = dict(df = join)
+        spec = dict(how = 'inner', on = None, left_on = None, right_on = None, suffix = '_right')
+        spec.update(join)
+        other = spec['df']
+        if isinstance(other, (tibble, LazyTibble)):
+            other = other.as_polars()
+        if (spec['on'] == None) & (spec['left_on'] == None) & (spec['right_on'] == None):
+            spec['on'] = [name for name in names if name in _names(other)]
+        if spec['on'] != None:
+            spec['left_on'] = spec['right_on'] = spec['on']
+        specs.append(dict(
+            df = other, how = spec['how'], suffix = spec['suffix'],
+            left_on = _as_list(spec['left_on']), right_on = _as_list(spec['right_on'])
+        ))
+        plan = _join_plan(plan, specs[-1:])
+        names = _names(plan)
+    return specs
+
+def _join_plan(plan, specs):
+    """Add the joins in `specs` to a lazy query plan"""
+    for spec in specs:
+        plan = plan.join(
+            spec['df'].lazy(), how = spec['how'], suffix = spec['suffix'],
+            left_on = spec['left_on'], right_on = spec['right_on'],
+            coalesce = True
+        )
+    return plan
+
+def _approx_n_unique(df, keys):
+    """Estimate the number of unique values of one or more key columns"""
+    if len(keys) == 1:
+        return df.select(pl.col(keys[0]).approx_n_unique()).item()
+    return df.select(pl.struct(keys).hash().approx_n_unique()).item()
+
+def _join_factor(df, spec):
+    """
+    Estimate how many rows a join returns per row of `df`
+    from the number of rows and unique keys of both sides
+    """
+    other = spec['df']
+    left_unique = _approx_n_unique(df, spec['left_on'])
+    right_unique = _approx_n_unique(other, spec['right_on'])
+    # Share of rows with a match, assuming the keys of the smaller side are found in the other
+    matched = min(1, right_unique / max(left_unique, 1))
+    rows_per_match = other.height / max(right_unique, 1)
+    if spec['how'] == 'inner':
+        return matched * rows_per_match
+    elif spec['how'] == 'semi':
+        return matched
+    elif spec['how'] == 'anti':
+        return 1 - matched
+    return matched * rows_per_match + 1 - matched
+
+def _keyed_join(df, other, left_on, right_on, how, suffix):
+    """
+    Join a keyed tibble by binary searching its sorted key instead of building a hash table.
+    Returns None if the join can't use the key.
+    """
+    index = other.__dict__.get('_key_index') if isinstance(other, tibble) else None
+    if (index is None) | not_(isinstance(df, pl.DataFrame)):
+        return None
+    left_on, right_on = _as_list(left_on), _as_list(right_on)
+    if (right_on != [index.name]) | (len(left_on) != 1):
+        return None
+    left_key = df.get_column(left_on[0])
+    if left_key.dtype != index.dtype:
+        return None
+    rows = index.search_sorted(left_key).clip(upper_bound = index.len() - 1)
+    found = (index.gather(rows) == left_key).fill_null(False)
+    if how == 'inner':
+        df, rows = df.filter(found), rows.filter(found)
+    else:
+        rows = pl.select(pl.when(found).then(rows)).to_series()
+    other = other.as_polars().drop(index.name)
+    other = other.rename({name: name + suffix for name in other.columns if name in df.columns})
+    return pl.concat([df, other.select(pl.all().gather(rows))], how = "horizontal")
+
 class tibble(pl.DataFrame):
     """
     A data frame object that provides methods familiar to R tidyverse users.
@@ -37,17 +233,17 @@ class tibble(pl.DataFrame):
 
     def __dir__(self):
         _tidypolars_methods = [
-            'arrange', 'as_dict', 'as_pandas', 'as_polars',
-            'bind_cols', 'bind_rows', 'colnames', 'clone', 'count',
+            'anti_join', 'arrange', 'as_dict', 'as_pandas', 'as_polars', 'asof_join',
+            'bind_cols', 'bind_rows', 'colnames', 'clone', 'compact', 'count',
             'distinct', 'drop', 'drop_null', 'head', 'fill', 'filter',
-            'glimpse',
-            'inner_join', 'left_join', 'mutate', 'names', 'nrow', 'ncol',
+            'glimpse', 'group_by',
+            'inequality_join', 'inner_join', 'join_all', 'key', 'lazy', 'left_join', 'mutate', 'names', 'nrow', 'ncol',
             'full_join', 'pivot_longer', 'pivot_wider',
             'print',
             'pull', 'relocate', 'rename', 'replace_null', 'select',
-            'separate', 'set_names',
+            'semi_join', 'separate', 'set_key', 'set_names',
             'slice', 'slice_head', 'slice_tail', 'summarize', 'tail',
-            'write_csv', 'write_parquet'
+            'write_csv', 'write_ipc', 'write_parquet'
         ]
         return _tidypolars_methods
     
@@ -72,6 +268,7 @@ class tibble(pl.DataFrame):
     def __copy__(self):
         # Shallow copy
         # See: https://stackoverflow.com/a/51043609/13254470
+        _collect_pending(self)
         obj = type(self).__new__(self.__class__)
         obj.__dict__.update(self.__dict__)
         return obj
@@ -81,14 +278,51 @@ class tibble(pl.DataFrame):
         df = self.as_polars()
         return df.__str__()
 
-    def __getattribute__(self, attr):
-        if attr in _polars_methods:
-            raise AttributeError
-        return pl.DataFrame.__getattribute__(self, attr)
-    
+    _df = _PendingData()
+
     def __getitem__(self, col):
         return self.pull(col)
 
+    def __arrow_c_stream__(self, requested_schema = None):
+        """
+        Export via the Arrow PyCapsule Interface
+
+        Lets Arrow consumers (pyarrow, duckdb, ...) read the tibble without copying.
+        See: https://arrow.apache.org/docs/format/CDataInterface/PyCapsuleInterface.html
+        """
+        return self._df.__arrow_c_stream__(requested_schema)
+
+    @_verb
+    def anti_join(self, df, left_on = None, right_on = None, on = None):
+        """
+        Keep rows of the data frame that have no match in `df`
+
+        Only the join columns of `df` are used, and rows of the left data frame are never duplicated.
+
+        Parameters
+        ----------
+        df : tibble
+            DataFrame to filter with.
+        left_on : str, list
+            Join column(s) of the left DataFrame.
+        right_on : str, list
+            Join column(s) of the right DataFrame.
+        on: str, list
+            Join column(s) of both DataFrames. If set, `left_on` and `right_on` should be None.
+
+        Examples
+        --------
+        >>> df1.anti_join(df2)
+        >>> df1.anti_join(df2, on = 'x')
+        >>> df1.anti_join(df2, left_on = 'left_x', right_on = 'x')
+        """
+        if (left_on == None) & (right_on == None) & (on == None):
+            on = list(set(self.names) & set(df.names))
+        df = _match_frame_type(self.as_polars(), df)
+        df = df.select(_as_list(right_on if on == None else on))
+        return self.as_polars().join(df, on, "anti", left_on = left_on, right_on = right_on).pipe(from_polars)
+
+    @_verb
     def arrange(self, *args):
         """
         Arrange/sort rows
@@ -109,7 +343,7 @@ class tibble(pl.DataFrame):
         """
         exprs = _as_list(args)
         desc = [True if isinstance(expr, DescCol) else False for expr in exprs]
-        return super().sort(exprs, descending = desc).pipe(from_polars)
+        return self.as_polars().sort(exprs, descending = desc).pipe(from_polars)
     
     def as_dict(self, *, as_series = True):
         """
@@ -126,17 +360,26 @@ class tibble(pl.DataFrame):
         >>> df.to_dict()
         >>> df.to_dict(as_series = False)
         """
-        return super().to_dict(as_series = as_series)
+        return self.as_polars().to_dict(as_series = as_series)
 
-    def as_pandas(self):
+    def as_pandas(self, arrow_dtypes = False, **kwargs):
         """
         Convert to a pandas DataFrame
 
+        Parameters
+        ----------
+        arrow_dtypes : bool
+            If True, use pyarrow backed `pd.ArrowDtype` columns. The arrow data is shared with
+            the tibble instead of being converted to numpy arrays and python string objects.
+        **kwargs :
+            Passed on to `polars.DataFrame.to_pandas()`
+
         Examples
         --------
         >>> df.as_pandas()
+        >>> df.as_pandas(arrow_dtypes = True)
         """
-        return self.as_polars().to_pandas()
+        return self.as_polars().to_pandas(use_pyarrow_extension_array = arrow_dtypes, **kwargs)
 
     def as_polars(self):
         """
@@ -146,9 +389,66 @@ class tibble(pl.DataFrame):
         --------
         >>> df.as_polars()
         """
-        self = copy.copy(self)
-        self.__class__ = pl.DataFrame
-        return self
+        return pl.DataFrame._from_pydf(self._df)
+
+    @_verb
+    def asof_join(self, df, left_on = None, right_on = None, on = None, by = None,
+                  strategy = 'backward', tolerance = None, suffix = '_right'):
+        """
+        Perform an as-of join
+
+        Each row is joined to the nearest row of `df` by key instead of an exact match,
+        e.g. each trade to the most recent quote at or before its timestamp.
+        Inputs are only sorted by the join columns if they aren't sorted already,
+        and the row order of the data frame is kept.
+
+        Parameters
+        ----------
+        df : tibble
+            DataFrame to join with.
+        left_on : str
+            Join column of the left DataFrame.
+        right_on : str
+            Join column of the right DataFrame.
+        on: str
+            Join column of both DataFrames. If set, `left_on` and `right_on` should be None.
+        by : str, list
+            Optional. Only join rows with the same values in these columns
+        strategy : str
+            One of 'backward' (last row with a key less than or equal to the key),
+            'forward' (first row with a key greater than or equal to the key), or 'nearest'
+        tolerance : str, int, float, timedelta
+            Optional. Largest distance between keys to still join rows.
+            Can be a duration string like "1m" for temporal keys.
+        suffix : str
+            Suffix to append to columns with a duplicate name.
+
+        Examples
+        --------
+        >>> trades.asof_join(quotes, on = 'time', by = 'ticker')
+        >>> trades.asof_join(quotes, on = 'time', by = 'ticker', strategy = 'nearest', tolerance = '1m')
+        """
+        if on != None:
+            left_on = right_on = on
+        out = self.as_polars()
+        if isinstance(df, (tibble, LazyTibble)):
+            df = df.as_polars()
+        df = _match_frame_type(out, df)
+        if not_(_is_sorted(df, right_on)):
+            df = df.sort(right_on)
+        keep_order = not_(_is_sorted(out, left_on))
+        if keep_order:
+            row_index = _unused_name(_names(out) + _names(df), '_row_index')
+            out = out.with_row_index(row_index).sort(left_on)
+        out = out.join_asof(
+            df, left_on = left_on, right_on = right_on, by = by,
+            strategy = strategy, tolerance = tolerance, suffix = suffix,
+            # Both sides are sorted above
+            check_sortedness = False
+        )
+        if keep_order:
+            out = out.sort(row_index).drop(row_index)
+        return out.pipe(from_polars)
 
     def bind_cols(self, *args):
         """
@@ -171,6 +471,7 @@ class tibble(pl.DataFrame):
             out = out.hstack(frame)
         return out.pipe(from_polars)
     
+    @_verb
     def bind_rows(self, *args):
         """
         Bind data frames by row
@@ -187,13 +488,64 @@ class tibble(pl.DataFrame):
         >>> df1.bind_rows(df2)
         """
         frames = _as_list(args)
-        out = pl.concat([self, *frames], how = "diagonal")
+        frames = [_match_frame_type(self.as_polars(), frame) for frame in frames]
+        out = pl.concat([self.as_polars(), *frames], how = "diagonal")
         return out.pipe(from_polars)
 
     def clone(self):
         """Very cheap deep clone"""
-        return super().clone().pipe(from_polars)
+        return self.as_polars().clone().pipe(from_polars)
+
+    def compact(self, categorical_ratio = 0.5, report = False):
+        """
+        Shrink columns to the smallest type that holds their values
+
+        * Integers are cast to the smallest integer type of the same signedness that fits their range
+        * Float64 columns are cast to Float32 if no values are changed
+        * String columns are cast to Categorical if at most `categorical_ratio` of the values are unique
 
+        The column statistics are computed in a single pass, and a column is only changed if it uses less memory.
+
+        Narrowed types leave no headroom: arithmetic on a compacted column is done in the
+        smaller type and can overflow and wrap around (e.g. `Int8` values above 127).
+        Cast back to a wider type before arithmetic that can leave the current range.
+
+        Parameters
+        ----------
+        categorical_ratio : float
+            Largest ratio of unique values to rows for a string column to become Categorical
+        report : bool
+            If True, also return a tibble with the bytes saved by each changed column
+
+        Examples
+        --------
+        >>> df = tp.tibble(x = range(3), y = [1.5, 2.5, 3.5], z = ['a', 'a', 'b'])
+        >>> df.compact()
+        >>> df, report = df.compact(report = True)
+        """
+        df = self.as_polars()
+        changes = []
+        for name, dtype in _compact_types(df, categorical_ratio).items():
+            before = df.get_column(name)
+            after = before.cast(dtype)
+            # Categoricals of short strings can be larger than the strings
+            if after.estimated_size() < before.estimated_size():
+                changes.append([name, str(before.dtype), str(after.dtype), before.estimated_size(), after.estimated_size()])
+                df = df.with_columns(after)
+        out = df.pipe(from_polars)
+        if not_(report):
+            return out
+        changes = pl.DataFrame(
+            changes,
+            schema = {
+                'column': pl.Utf8, 'old_type': pl.Utf8, 'new_type': pl.Utf8,
+                'bytes_before': pl.Int64, 'bytes_after': pl.Int64
+            },
+            orient = 'row'
+        ).with_columns(bytes_saved = pl.col('bytes_before') - pl.col('bytes_after'))
+        return out, changes.pipe(from_polars)
+
+    @_verb
     def count(self, *args, sort = False, name = 'n'):
         """
         Returns row counts of the dataset. 
@@ -223,6 +575,7 @@ class tibble(pl.DataFrame):
 
         return out
 
+    @_verb
     def distinct(self, *args):
         """
         Select distinct/unique rows
@@ -240,11 +593,12 @@ class tibble(pl.DataFrame):
         """
         args = _as_list(args)
         if len(args) == 0:
-            df = super().unique()
+            df = self.as_polars().unique()
         else:
-            df = super().select(args).unique()
+            df = self.as_polars().select(args).unique()
         return df.pipe(from_polars)
 
+    @_verb
     def drop(self, *args):
         """
         Drop unwanted columns
@@ -258,10 +612,11 @@ class tibble(pl.DataFrame):
         --------
         >>> df.drop('x', 'y')
         """
-        args = _as_list(args)
-        drop_cols = self.select(args).names
-        return super().drop(drop_cols).pipe(from_polars)
+        df = self.as_polars()
+        drop_cols = _select_names(df, args)
+        return df.drop(drop_cols).pipe(from_polars)
 
+    @_verb
     def drop_null(self, *args):
         """
         Drop rows containing missing values
@@ -279,9 +634,9 @@ class tibble(pl.DataFrame):
         """
         args = _as_list(args)
         if len(args) == 0:
-            out = super().drop_nulls()
+            out = self.as_polars().drop_nulls()
         else:
-            out = super().drop_nulls(args)
+            out = self.as_polars().drop_nulls(args)
         return out.pipe(from_polars)
     
     def equals(self, other, null_equal = True):
@@ -299,6 +654,7 @@ class tibble(pl.DataFrame):
         """
         return self.as_polars().glimpse()
 
+    @_verb
     def fill(self, *args, direction = 'down', _by = None):
         """
         Fill in missing values with previous or next value
@@ -344,6 +700,7 @@ class tibble(pl.DataFrame):
 
         return self.mutate(*exprs, _by = _by)
 
+    @_verb
     def filter(self, *args,
                _by = None):
         """
@@ -367,12 +724,11 @@ class tibble(pl.DataFrame):
         exprs = ft.reduce(lambda a, b: a & b, args)
 
         if _uses_by(_by):
-            out = super().group_by(_by).map_groups(lambda x: x.filter(exprs))
-        else:
-            out = super().filter(exprs)
-        
-        return out.pipe(from_polars)
+            exprs = exprs.over(_by)
+
+        return self.as_polars().filter(exprs).pipe(from_polars)
     
+    @_verb
     def full_join(self, df, left_on = None, right_on = None, on = None, suffix: str = '_right'):
         """
         Perform an full join
@@ -398,13 +754,74 @@ class tibble(pl.DataFrame):
         """
         if (left_on == None) & (right_on == None) & (on == None):
             on = list(set(self.names) & set(df.names))
-        out = super().join(df, on, "full", left_on = left_on, right_on = right_on, suffix = suffix, coalesce = True)
+        df = _match_frame_type(self.as_polars(), df)
+        out = self.as_polars().join(df, on, "full", left_on = left_on, right_on = right_on, suffix = suffix, coalesce = True)
         return out.pipe(from_polars)
     
-    def head(self, n = 5, *, _by = None):
+    def group_by(self, *args):
+        """
+        Group a data frame by one or more columns
+
+        The group of each row is computed once and reused by all
+        later grouped verbs.
+
+        Parameters
+        ----------
+        *args : str, Expr
+            Columns to group by
+
+        Examples
+        --------
+        >>> df = tp.tibble({'a': range(3), 'b': range(3), 'c': ['a', 'a', 'b']})
+        >>> (
+        ...     df.group_by('c')
+        ...     .mutate(avg_a = tp.mean('a'))
+        ...     .filter(col('b') >= col('avg_a'))
+        ...     .ungroup()
+        ... )
+        """
+        groups = _select_names(self.as_polars(), args)
+        return GroupedTibble(self, groups)
+
+    @_verb
+    def head(self, n = 5, *, _by = None, _keep_order = True):
         """Alias for `.slice_head()`"""
-        return self.slice_head(n, _by = _by)
+        return self.slice_head(n, _by = _by, _keep_order = _keep_order)
+
+    @_verb
+    def inequality_join(self, df, *args, how = 'inner', suffix = '_right'):
+        """
+        Join rows that meet inequality or range conditions
+
+        For example events to the intervals they fall in (`start <= time < end`).
+        Uses a sort-based join instead of filtering a cross join,
+        so memory use grows with the number of matches.
+        The row order of the output is not guaranteed.
+
+        Parameters
+        ----------
+        df : tibble
+            DataFrame to join with.
+        *args : Expr
+            Conditions comparing columns of both DataFrames, e.g. `col('time') >= col('start')`.
+            Refer to columns of `df` with a duplicate name by adding `suffix` to their name.
+        how : str
+            One of 'inner' or 'left'
+        suffix : str
+            Suffix to append to columns with a duplicate name.
+
+        Examples
+        --------
+        >>> events.inequality_join(intervals, col('time') >= col('start'), col('time') < col('end'))
+        >>> events.inequality_join(intervals, tp.between(col('time'), col('start'), col('end')))
+        """
+        df = _match_frame_type(self.as_polars(), df)
+        if isinstance(df, (tibble, LazyTibble)):
+            df = df.as_polars()
+        out = self.as_polars().join_where(df, *_as_list(args), how = how, suffix = suffix)
+        return out.pipe(from_polars)
 
+    @_verb
     def inner_join(self, df, left_on = None, right_on = None, on = None, suffix = '_right'):
         """
         Perform an inner join
@@ -430,8 +847,84 @@ class tibble(pl.DataFrame):
         """
         if (left_on == None) & (right_on == None) & (on == None):
             on = list(set(self.names) & set(df.names))
-        return super().join(df, on, 'inner', left_on = left_on, right_on= right_on, suffix= suffix).pipe(from_polars)
+        out = _keyed_join(self.as_polars(), df, left_on or on, right_on or on, 'inner', suffix)
+        if out is not None:
+            return out.pipe(from_polars)
+        df = _match_frame_type(self.as_polars(), df)
+        return self.as_polars().join(df, on, 'inner', left_on = left_on, right_on= right_on, suffix= suffix).pipe(from_polars)
+
+    @_verb
+    def join_all(self, joins, reorder = True):
+        """
+        Join several data frames in a single query plan
+
+        Joins that only use columns of this data frame are reordered by their estimated
+        number of output rows, so selective joins run first and shrink later joins.
+        Estimates use the number of rows and unique keys of each data frame,
+        so joins are only reordered when all data frames are in memory. On a LazyTibble
+        (or with `tp.options(deferred = True)`) the joins run in the written order.
+        The output has the same columns as running the joins in the written order,
+        but the row order can differ.
+
+        Parameters
+        ----------
+        joins : list
+            Data frames to join (using an inner join on the columns in common),
+            or dicts with a `df` key and optionally `how`, `on`, `left_on`, `right_on` and `suffix`.
+            `how` can be 'inner', 'left', 'semi', 'anti' or 'full'.
+        reorder : bool
+            If False, run the joins in the written order
+
+        Examples
+        --------
+        >>> sales.join_all([
+        ...     dict(df = products, on = 'product_id', how = 'left'),
+        ...     dict(df = stores, on = 'store_id'),
+        ...     dict(df = promos, on = 'promo_id', how = 'semi')
+        ... ])
+        """
+        df = self.as_polars()
+        specs = _join_specs(df, joins)
+        plan = _join_plan(df.lazy(), specs)
+        frames = [df] + [spec['df'] for spec in specs]
+        can_estimate = all(isinstance(frame, pl.DataFrame) for frame in frames)
+        uses_full = any(spec['how'] == 'full' for spec in specs)
+        # Reordering would change which of two columns with the same name gets the suffix
+        added = _names(df) + [
+            name
+            for spec in specs if spec['how'] not in ['semi', 'anti']
+            for name in _names(spec['df']) if name not in spec['right_on']
+        ]
+        has_collisions = len(added) > len(set(added))
+        if reorder & can_estimate & not_(uses_full) & not_(has_collisions):
+            base_names = set(_names(df))
+            movable = [spec for spec in specs if set(spec['left_on']) <= base_names]
+            fixed = [spec for spec in specs if not_(set(spec['left_on']) <= base_names)]
+            if len(movable) > 1:
+                movable = sorted(movable, key = lambda spec: _join_factor(df, spec))
+                plan = _join_plan(df.lazy(), movable + fixed).select(_names(plan))
+        if isinstance(df, pl.DataFrame):
+            plan = plan.collect()
+        return plan.pipe(from_polars)
+
+    def lazy(self):
+        """
+        Convert to a LazyTibble
+
+        Verbs called on a LazyTibble build a single query plan that
+        is only executed when calling `.collect()`
+
+        Examples
+        --------
+        >>> df = tp.tibble(x = range(3), y = ['a', 'a', 'b'])
+        >>> df.lazy().filter(col('x') < 2).mutate(double_x = col('x') * 2).collect()
+        """
+        pending = self.__dict__.get('_pending')
+        if pending is not None:
+            return pending.pipe(from_polars)
+        return self.as_polars().lazy().pipe(from_polars)
 
+    @_verb
     def left_join(self, df, left_on = None, right_on = None, on = None, suffix = '_right'):
         """
         Perform a left join
@@ -457,8 +950,13 @@ class tibble(pl.DataFrame):
         """
         if (left_on == None) & (right_on == None) & (on == None):
             on = list(set(self.names) & set(df.names))
-        return super().join(df, on, 'left',  left_on = left_on, right_on= right_on, suffix= suffix).pipe(from_polars)
+        out = _keyed_join(self.as_polars(), df, left_on or on, right_on or on, 'left', suffix)
+        if out is not None:
+            return out.pipe(from_polars)
+        df = _match_frame_type(self.as_polars(), df)
+        return self.as_polars().join(df, on, 'left',  left_on = left_on, right_on= right_on, suffix= suffix).pipe(from_polars)
 
+    @_verb
     def mutate(self, *args,
                _by = None,
                **kwargs):
@@ -486,12 +984,13 @@ class tibble(pl.DataFrame):
         out = self.as_polars()
 
         if _uses_by(_by):
-            out = out.group_by(_by).map_groups(lambda x: _mutate_cols(x, exprs))
+            out = _mutate_cols_by(out, exprs, _by)
         else:
             out = _mutate_cols(out, exprs)
             
         return out.pipe(from_polars)
 
+    @_verb
     def pivot_longer(self,
                      cols = everything(),
                      names_to = "name",
@@ -514,10 +1013,10 @@ class tibble(pl.DataFrame):
         >>> df.pivot_longer(cols = ['a', 'b'])
         >>> df.pivot_longer(cols = ['a', 'b'], names_to = 'stuff', values_to = 'things')
         """
-        df_cols = pl.Series(self.names)
-        value_vars = self.select(cols).names
-        id_vars = df_cols.filter(df_cols.is_in(value_vars).not_()).to_list()
-        out = super().unpivot(index = id_vars, on = value_vars, variable_name = names_to, value_name = values_to)
+        df = self.as_polars()
+        value_vars = _select_names(df, cols)
+        id_vars = [name for name in self.names if name not in value_vars]
+        out = df.unpivot(index = id_vars, on = value_vars, variable_name = names_to, value_name = values_to)
         return out.pipe(from_polars)
 
     def pivot_wider(self,
@@ -552,9 +1051,8 @@ class tibble(pl.DataFrame):
         >>> df.pivot_wider(names_from = 'variable', values_from = 'value')
         """
         if id_cols == None:
-            df_cols = pl.Series(self.names)
-            from_cols = pl.Series(self.select(names_from, values_from).names)
-            id_cols = df_cols.filter(df_cols.is_in(from_cols).not_()).to_list()
+            from_cols = _select_names(self.as_polars(), [names_from, values_from])
+            id_cols = [name for name in self.names if name not in from_cols]
 
         no_id = len(id_cols) == 0
 
@@ -563,7 +1061,7 @@ class tibble(pl.DataFrame):
             self = self.mutate(_id = pl.lit(1))
 
         out = (
-            super()
+            self.as_polars()
             .pivot(values = values_from, index = id_cols, on = names_from, aggregate_function = values_fn)
             .pipe(from_polars)
         )
@@ -598,8 +1096,9 @@ class tibble(pl.DataFrame):
         if var == None:
             var = self.names[-1]
         
-        return super().get_column(var)
+        return self.as_polars().get_column(var)
     
+    @_verb
     def relocate(self, *args, _before = None, _after = None):
         """
         Move a column or columns to a new position
@@ -615,15 +1114,11 @@ class tibble(pl.DataFrame):
         >>> df.relocate('a', before = 'c')
         >>> df.relocate('b', after = 'c')
         """
-        cols_all = pl.Series(self.names)
-        locs_all = pl.Series(range(len(cols_all)))
-        locs_dict = {k:v for k,v in zip(cols_all, locs_all)}
-        locs_df = pl.DataFrame(locs_dict, orient = "row")
-
-        cols_relocate = _as_list(args)
-        locs_relocate = pl.Series(locs_df.select(cols_relocate).row(0))
+        df = self.as_polars()
+        cols_all = self.names
+        cols_relocate = _select_names(df, args)
 
-        if (len(locs_relocate) == 0):
+        if (len(cols_relocate) == 0):
             return self
 
         uses_before = _is_expr(_before) | _is_string(_before)
@@ -636,18 +1131,17 @@ class tibble(pl.DataFrame):
             uses_before = True
 
         if uses_before:
-            _before = locs_df.select(_before).get_column(_before)
-            locs_start = locs_all.filter(locs_all < _before)
+            loc = cols_all.index(_select_names(df, _before)[0])
         else:
-            _after = locs_df.select(_after).get_column(_after)
-            locs_start = locs_all.filter(locs_all <= _after)
+            loc = cols_all.index(_select_names(df, _after)[0]) + 1
 
-        locs_start = locs_start.filter(~locs_start.is_in(locs_relocate))
-        final_order = pl.concat([locs_start, locs_relocate, locs_all]).unique(maintain_order = True)
-        final_order = cols_all[final_order].to_list()
+        cols_start = [name for name in cols_all[:loc] if name not in cols_relocate]
+        cols_end = [name for name in cols_all[loc:] if name not in cols_relocate]
+        final_order = cols_start + cols_relocate + cols_end
 
         return self.select(final_order)
    
+    @_verb
     def rename(self, _mapping = None, **kwargs):
         """
         Rename columns
@@ -667,8 +1161,9 @@ class tibble(pl.DataFrame):
         """
         if _mapping == None:
             _mapping = {value:key for key, value in kwargs.items()} 
-        return super().rename(_mapping).pipe(from_polars)
+        return self.as_polars().rename(_mapping).pipe(from_polars)
 
+    @_verb
     def replace_null(self, replace = None):
         """
         Replace null values
@@ -689,6 +1184,37 @@ class tibble(pl.DataFrame):
         replace_exprs = [col(key).fill_null(value) for key, value in replace.items()]
         return self.mutate(*replace_exprs)
 
+    @_verb
+    def semi_join(self, df, left_on = None, right_on = None, on = None):
+        """
+        Keep rows of the data frame that have a match in `df`
+
+        Only the join columns of `df` are used, and rows of the left data frame are never duplicated.
+
+        Parameters
+        ----------
+        df : tibble
+            DataFrame to filter with.
+        left_on : str, list
+            Join column(s) of the left DataFrame.
+        right_on : str, list
+            Join column(s) of the right DataFrame.
+        on: str, list
+            Join column(s) of both DataFrames. If set, `left_on` and `right_on` should be None.
+
+        Examples
+        --------
+        >>> df1.semi_join(df2)
+        >>> df1.semi_join(df2, on = 'x')
+        >>> df1.semi_join(df2, left_on = 'left_x', right_on = 'x')
+        """
+        if (left_on == None) & (right_on == None) & (on == None):
+            on = list(set(self.names) & set(df.names))
+        df = _match_frame_type(self.as_polars(), df)
+        df = df.select(_as_list(right_on if on == None else on))
+        return self.as_polars().join(df, on, "semi", left_on = left_on, right_on = right_on).pipe(from_polars)
+
+    @_verb
     def separate(self, sep_col, into, sep = '_', remove = True):
         """
         Separate a character column into multiple columns
@@ -710,22 +1236,13 @@ class tibble(pl.DataFrame):
         >>> df.separate('x', into = ['left', 'right'])
         """
         into_len = len(into) - 1
-        sep_df = (
-            self
-            .as_polars()
-            .select(col(sep_col)
-                    .str.split_exact(sep, into_len)
-                    .alias("_seps")
-                    .struct
-                    .rename_fields(into))
-            .unnest("_seps")
-            .pipe(from_polars)
-        )
-        out = self.bind_cols(sep_df)
-        if remove == True:
+        seps = col(sep_col).str.split_exact(sep, into_len).struct.rename_fields(into)
+        out = self.as_polars().with_columns([seps.struct.field(name) for name in into])
+        if (remove == True) & (sep_col not in into):
             out = out.drop(sep_col)
-        return out
+        return out.pipe(from_polars)
 
+    @_verb
     def set_names(self, nm = None):
         """
         Change the column names of the data frame
@@ -745,6 +1262,7 @@ class tibble(pl.DataFrame):
         rename_dict = {k:v for k, v in zip(self.names, nm)}
         return self.rename(rename_dict)
     
+    @_verb
     def select(self, *args):
         """
         Select or drop columns
@@ -762,9 +1280,44 @@ class tibble(pl.DataFrame):
         """
         args = _as_list(args)
         args = _col_exprs(args)
-        return super().select(args).pipe(from_polars)
+        return self.as_polars().select(args).pipe(from_polars)
+
+    def set_key(self, *args):
+        """
+        Sort by key columns and keep the sorted key as a join index
+
+        When a keyed tibble is joined onto another tibble with `.left_join()` or `.inner_join()`
+        on its key, rows are matched with a binary search on the sorted key
+        instead of building a hash table for every join.
+        This speeds up joining the same tibble (e.g. a dimension table) many times.
+
+        The index is only used for a single key column without duplicates or nulls.
+        Other joins work as usual. Verbs return tibbles without a key.
+
+        Parameters
+        ----------
+        *args : str, Expr
+            Key columns
 
-    def slice(self, *args, _by = None):
+        Examples
+        --------
+        >>> dim = tp.tibble(id = range(3), label = ['a', 'b', 'c']).set_key('id')
+        >>> batch = tp.tibble(id = [2, 0, 5], value = range(3))
+        >>> batch.left_join(dim, on = 'id')
+        """
+        df = self.as_polars()
+        key = _select_names(df, args)
+        df = df.sort(key)
+        out = df.pipe(from_polars)
+        out.__dict__['_key'] = key
+        if len(key) == 1:
+            key_col = df.get_column(key[0])
+            if (key_col.null_count() == 0) & key_col.is_unique().all() & (key_col.len() > 0):
+                out.__dict__['_key_index'] = key_col
+        return out
+
+    @_verb
+    def slice(self, *args, _by = None, _keep_order = False):
         """
         Grab rows from a data frame
 
@@ -774,6 +1327,11 @@ class tibble(pl.DataFrame):
             Rows to grab
         by : str, list
             Columns to group by
+        _keep_order : bool
+            If False (the default), grouped output rows are sorted by the groups
+            and rows are returned in the requested order within each group.
+            If True, grouped output rows keep the order of the input,
+            and rows requested more than once are only returned once.
 
         Examples
         --------
@@ -782,13 +1340,18 @@ class tibble(pl.DataFrame):
         >>> df.slice(0, by = 'c')
         """
         rows = _as_list(args)
-        if _uses_by(_by):
-            df = super(tibble, self).group_by(_by).map_groups(lambda x: x.select(pl.all().gather(rows)))
+        if _uses_by(_by) & _keep_order:
+            row_index = pl.int_range(pl.len())
+            in_rows = row_index.is_in(rows) | (row_index - pl.len()).is_in(rows)
+            df = _filter_group_rows(self.as_polars(), in_rows, _by)
+        elif _uses_by(_by):
+            df = _gather_group_rows(self.as_polars(), rows, _by)
         else:
-            df = super(tibble, self).select(pl.all().gather(rows))
+            df = self.as_polars().select(pl.all().gather(rows))
         return df.pipe(from_polars)
 
-    def slice_head(self, n = 5, *, _by = None):
+    @_verb
+    def slice_head(self, n = 5, *, _by = None, _keep_order = True):
         """
         Grab top rows from a data frame
 
@@ -798,6 +1361,9 @@ class tibble(pl.DataFrame):
             Number of rows to grab
         by : str, list
             Columns to group by
+        _keep_order : bool
+            If True, grouped output rows keep the order of the input.
+            If False, grouped output rows are sorted by the groups.
 
         Examples
         --------
@@ -805,15 +1371,15 @@ class tibble(pl.DataFrame):
         >>> df.slice_head(2)
         >>> df.slice_head(1, by = 'c')
         """
-        col_order = self.names
         if _uses_by(_by):
-            df = super(tibble, self).group_by(_by).head(n)
+            in_head = pl.int_range(pl.len()) < n
+            df = _filter_group_rows(self.as_polars(), in_head, _by, _keep_order)
         else:
-            df = super(tibble, self).head(n)
-        df = df.select(col_order)
+            df = self.as_polars().head(n)
         return df.pipe(from_polars)
 
-    def slice_tail(self, n = 5, *, _by = None):
+    @_verb
+    def slice_tail(self, n = 5, *, _by = None, _keep_order = True):
         """
         Grab bottom rows from a data frame
 
@@ -823,6 +1389,9 @@ class tibble(pl.DataFrame):
             Number of rows to grab
         by : str, list
             Columns to group by
+        _keep_order : bool
+            If True, grouped output rows keep the order of the input.
+            If False, grouped output rows are sorted by the groups.
 
         Examples
         --------
@@ -830,20 +1399,21 @@ class tibble(pl.DataFrame):
         >>> df.slice_tail(2)
         >>> df.slice_tail(1, by = 'c')
         """
-        col_order = self.names
         if _uses_by(_by):
-            df = super(tibble, self).group_by(_by).tail(n)
+            in_tail = pl.int_range(pl.len()) >= pl.len() - n
+            df = _filter_group_rows(self.as_polars(), in_tail, _by, _keep_order)
         else:
-            df = super(tibble, self).tail(n)
-        df = df.select(col_order)
+            df = self.as_polars().tail(n)
         return df.pipe(from_polars)
     
+    @_verb
     def summarise(self, *args,
                   _by = None,
                   **kwargs):
         """Alias for `.summarize()`"""
         return self.summarize(*args, _by = _by, **kwargs)
     
+    @_verb
     def summarize(self, *args,
                   _by = None,
                   **kwargs):
@@ -870,15 +1440,17 @@ class tibble(pl.DataFrame):
         """
         exprs = _as_list(args) + _kwargs_as_exprs(kwargs)
         if _uses_by(_by):
-            out = super(tibble, self).group_by(_by).agg(exprs)
+            out = self.as_polars().group_by(_by).agg(exprs)
         else:
-            out = super(tibble, self).select(exprs)
+            out = self.as_polars().select(exprs)
         return out.pipe(from_polars)
 
-    def tail(self, n = 5, *, _by = None):
+    @_verb
+    def tail(self, n = 5, *, _by = None, _keep_order = True):
         """Alias for `.slice_tail()`"""
-        return self.slice_tail(n, _by = _by)
+        return self.slice_tail(n, _by = _by, _keep_order = _keep_order)
 
+    @_verb
     def unite(self, col = "_united", unite_cols = [], sep = "_", remove = True):
         """
         Unite multiple columns by pasting strings together
@@ -902,7 +1474,7 @@ class tibble(pl.DataFrame):
         if len(unite_cols) == 0:
             unite_cols = self.names
         else:
-            unite_cols = self.select(unite_cols).names
+            unite_cols = _select_names(self.as_polars(), unite_cols)
         _before = unite_cols[0]
         unite_cols = _col_exprs(unite_cols)
         out = self.mutate(str_c(*unite_cols, sep = sep).alias(col))
@@ -916,15 +1488,79 @@ class tibble(pl.DataFrame):
                   has_headers = True,
                   sep = ','):
         """Write a data frame to a csv"""
-        return super().write_csv(file, include_header = has_headers, separator = sep)
+        return self.as_polars().write_csv(file, include_header = has_headers, separator = sep)
+
+    def write_ipc(self,
+                  file = None,
+                  compression = 'uncompressed',
+                  **kwargs):
+        """
+        Write a data frame to an Arrow IPC (Feather v2) file
+
+        Uncompressed files can be memory mapped by `tp.read_ipc()`.
+
+        Parameters
+        ----------
+        file : str
+            Path to the file
+        compression : str
+            Compression method. One of 'uncompressed', 'lz4', or 'zstd'.
+        **kwargs :
+            Passed on to `polars.DataFrame.write_ipc()`
+
+        Examples
+        --------
+        >>> df.write_ipc("data.arrow")
+        """
+        return self.as_polars().write_ipc(file, compression = compression, **kwargs)
 
     def write_parquet(self,
                       file = str,
                       compression = 'snappy',
                       use_pyarrow = False,
+                      partition_by = None,
+                      row_group_size = None,
+                      statistics = True,
                       **kwargs):
-        """Write a data frame to a parquet"""
-        return super().write_parquet(file, compression = compression, use_pyarrow = use_pyarrow, **kwargs)
+        """
+        Write a data frame to a parquet
+
+        Parameters
+        ----------
+        file : str
+            Path to the file. When using `partition_by` the directory to write to.
+        compression : str
+            Compression method
+        use_pyarrow : bool
+            Use pyarrow instead of the polars parquet writer
+        partition_by : str, list
+            Optional. Columns to partition by. Writes one hive partitioned directory
+            per group (`file/year=2026/...`) in parallel. Readers skip the partitions that
+            don't match filters on these columns.
+        row_group_size : int
+            Optional. Number of rows in each row group
+        statistics : bool
+            Write min/max statistics for each row group,
+            so readers can skip row groups that don't match a filter
+        **kwargs :
+            Passed on to `polars.DataFrame.write_parquet()`
+
+        Examples
+        --------
+        >>> df.write_parquet("data.parquet", row_group_size = 100000)
+        >>> df.write_parquet("lake", partition_by = ['year', 'month'])
+        """
+        if partition_by != None:
+            partition_by = _as_list(partition_by)
+        return self.as_polars().write_parquet(
+            file,
+            compression = compression,
+            use_pyarrow = use_pyarrow,
+            partition_by = partition_by,
+            row_group_size = row_group_size,
+            statistics = statistics,
+            **kwargs
+        )
     
     @property
     def names(self):
@@ -935,7 +1571,22 @@ class tibble(pl.DataFrame):
         --------
         >>> df.names
         """
-        return super().columns
+        # Deferred tibbles get the names from the schema without running the pending plan
+        pending = self.__dict__.get('_pending')
+        if pending is not None:
+            return _names(pending)
+        return _names(self.as_polars())
+
+    @property
+    def key(self):
+        """
+        Get the key columns set by `.set_key()`
+
+        Examples
+        --------
+        >>> df.set_key('x').key
+        """
+        return self.__dict__.get('_key')
 
     @property
     def ncol(self):
@@ -946,7 +1597,7 @@ class tibble(pl.DataFrame):
         --------
         >>> df.ncol
         """
-        return super().shape[1]
+        return len(self.names)
 
     @property
     def nrow(self):
@@ -957,7 +1608,7 @@ class tibble(pl.DataFrame):
         --------
         >>> df.nrow
         """
-        return super().shape[0]
+        return self.as_polars().shape[0]
     
     @property
     def plot(self):
@@ -968,7 +1619,646 @@ class tibble(pl.DataFrame):
         --------
         >>> df.plot
         """
-        return super().plot
+        return self.as_polars().plot
+
+class LazyTibble(pl.LazyFrame):
+    """
+    A lazy tibble. Verbs build up a polars query plan that is
+    optimized and executed as a whole when calling `.collect()`.
+
+    Examples
+    --------
+    >>> df = tp.tibble(x = range(3), y = ['a', 'a', 'b'])
+    >>> df.lazy().filter(col('x') < 2).select('x').collect()
+    """
+    def __init__(self, _data = None, **kwargs):
+        if len(kwargs) > 0:
+            _data = kwargs
+        elif not_(isinstance(_data, dict)):
+            raise ValueError("_data must be a dictionary or kwargs must be used")
+        super().__init__(_data)
+
+    def __dir__(self):
+        _tidypolars_methods = [
+            'anti_join', 'arrange', 'as_polars', 'asof_join', 'bind_rows', 'collect', 'count',
+            'distinct', 'drop', 'drop_null', 'explain', 'head', 'fill', 'filter',
+            'inequality_join', 'inner_join', 'join_all', 'left_join', 'mutate', 'names', 'ncol',
+            'full_join', 'pivot_longer', 'profile',
+            'relocate', 'rename', 'replace_null', 'select', 'semi_join', 'separate', 'set_names',
+            'sink_csv', 'sink_ipc', 'sink_parquet',
+            'slice', 'slice_head', 'slice_tail', 'summarize', 'tail',
+            'unite'
+        ]
+        return _tidypolars_methods
+
+    __copy__ = tibble.__copy__
+
+    # Verbs applied to this LazyTibble. See `_verb()`
+    _steps = []
+
+    def as_polars(self):
+        """
+        Convert to a polars LazyFrame
+
+        Examples
+        --------
+        >>> df.as_polars()
+        """
+        return pl.LazyFrame._from_pyldf(self._ldf)
+
+    def collect(self, streaming = False, **kwargs):
+        """
+        Execute the query plan and return a tibble
+
+        Parameters
+        ----------
+        streaming : bool
+            If True, run the query with the streaming engine, which processes
+            the data in batches instead of loading all of it in memory at once.
+        **kwargs :
+            Passed on to `polars.LazyFrame.collect()`
+
+        Examples
+        --------
+        >>> df.lazy().filter(col('x') < 2).collect()
+        >>> tp.scan_parquet("data.parquet").filter(col('x') < 2).collect(streaming = True)
+        """
+        if streaming == True:
+            kwargs['engine'] = 'streaming'
+        return self.as_polars().collect(**kwargs).pipe(from_polars)
+
+    def explain(self, optimized = True, **kwargs):
+        """
+        Show the query plan
+
+        Each node of the plan is labeled with the verb that added it.
+        Nodes of the optimized plan can be moved or merged by polars, so
+        only nodes that are still recognizable are labeled.
+
+        Parameters
+        ----------
+        optimized : bool
+            If True, show the optimized query plan. Otherwise show the plan as written.
+        **kwargs :
+            Passed on to `polars.LazyFrame.explain()`
+
+        Examples
+        --------
+        >>> df.lazy().filter(col('x') < 2).mutate(y = col('x') * 2).explain()
+        """
+        plan = self.as_polars().explain(optimized = optimized, **kwargs)
+        nodes = _step_nodes(self._steps)
+        lines = []
+        for line in plan.split('\n'):
+            for i, step in reversed(list(enumerate(self._steps))):
+                if line.strip() in nodes[i]:
+                    line = f"{line}  <- step {i}: {step.name}"
+                    break
+            lines.append(line)
+        return '\n'.join(lines)
+
+    def profile(self):
+        """
+        Run the query plan one verb at a time and time each step
+
+        Each verb is collected separately, so the timings show where time is spent
+        but add up to more than running the optimized plan, which is timed as the last step.
+
+        The source is collected in full as the first step, so projection and predicate pushdown
+        into the source don't happen: profiling a `scan_parquet()` or `scan_csv()` reads the whole
+        file into memory. Profile a smaller sample of the data when the source is large.
+
+        Returns
+        -------
+        tuple of (tibble, tibble)
+            The collected results and a tibble of timings with the step, verb,
+            number of rows returned, and wall time in milliseconds.
+
+        Examples
+        --------
+        >>> df, timings = df.lazy().filter(col('x') < 2).mutate(y = col('x') * 2).profile()
+        """
+        steps = self._steps
+        if len(steps) == 0:
+            steps = [_Step('source', None, (), {}, self.as_polars())]
+        timings = []
+        for i, step in enumerate(steps):
+            start = time.perf_counter()
+            if i == 0:
+                out = step.plan.collect()
+            else:
+                out = step.verb(out.lazy().pipe(from_polars), *step.args, **step.kwargs).as_polars().collect()
+            timings.append([i, step.name, out.height, (time.perf_counter() - start) * 1000])
+        start = time.perf_counter()
+        out = self.as_polars().collect()
+        timings.append([None, 'optimized plan', out.height, (time.perf_counter() - start) * 1000])
+        timings = pl.DataFrame(
+            timings,
+            schema = {'step': pl.Int64, 'verb': pl.Utf8, 'rows': pl.Int64, 'time_ms': pl.Float64},
+            orient = 'row'
+        )
+        return out.pipe(from_polars), timings.pipe(from_polars)
+
+    def sink_csv(self,
+                 file,
+                 has_headers = True,
+                 sep = ',',
+                 **kwargs):
+        """
+        Stream the results of the query plan to a csv file
+
+        The data is processed in batches, so the results don't need to fit in memory.
+
+        Examples
+        --------
+        >>> tp.scan_csv("in.csv").filter(col('x') < 2).sink_csv("out.csv")
+        """
+        return self.as_polars().sink_csv(file, include_header = has_headers, separator = sep, **kwargs)
+
+    def sink_ipc(self,
+                 file,
+                 compression = 'uncompressed',
+                 **kwargs):
+        """
+        Stream the results of the query plan to an Arrow IPC (Feather v2) file
+
+        The data is processed in batches, so the results don't need to fit in memory.
+
+        Examples
+        --------
+        >>> tp.scan_ipc("in.arrow").filter(col('x') < 2).sink_ipc("out.arrow")
+        """
+        return self.as_polars().sink_ipc(file, compression = compression, **kwargs)
+
+    def sink_parquet(self,
+                     file,
+                     compression = 'snappy',
+                     partition_by = None,
+                     **kwargs):
+        """
+        Stream the results of the query plan to a parquet file
+
+        The data is processed in batches, so the results don't need to fit in memory.
+
+        Parameters
+        ----------
+        file : str
+            Path to the file. When using `partition_by` the directory to write to.
+        compression : str
+            Compression method
+        partition_by : str, list
+            Optional. Columns to partition by. Writes one hive partitioned directory
+            per group (`file/year=2026/...`).
+        **kwargs :
+            Passed on to `polars.LazyFrame.sink_parquet()`, e.g. `row_group_size` or `statistics`
+
+        Examples
+        --------
+        >>> tp.scan_parquet("in.parquet").filter(col('x') < 2).sink_parquet("out.parquet")
+        >>> tp.scan_parquet("in.parquet").sink_parquet("lake", partition_by = 'year')
+        """
+        if partition_by != None:
+            file = pl.PartitionBy(file, key = _as_list(partition_by))
+        return self.as_polars().sink_parquet(file, compression = compression, **kwargs)
+
+    # Verbs shared with tibble
+    anti_join = tibble.anti_join
+    arrange = tibble.arrange
+    asof_join = tibble.asof_join
+    bind_rows = tibble.bind_rows
+    count = tibble.count
+    distinct = tibble.distinct
+    drop = tibble.drop
+    drop_null = tibble.drop_null
+    fill = tibble.fill
+    filter = tibble.filter
+    full_join = tibble.full_join
+    head = tibble.head
+    inequality_join = tibble.inequality_join
+    inner_join = tibble.inner_join
+    join_all = tibble.join_all
+    left_join = tibble.left_join
+    mutate = tibble.mutate
+    pivot_longer = tibble.pivot_longer
+    relocate = tibble.relocate
+    rename = tibble.rename
+    replace_null = tibble.replace_null
+    select = tibble.select
+    semi_join = tibble.semi_join
+    separate = tibble.separate
+    set_names = tibble.set_names
+    slice = tibble.slice
+    slice_head = tibble.slice_head
+    slice_tail = tibble.slice_tail
+    summarise = tibble.summarise
+    summarize = tibble.summarize
+    tail = tibble.tail
+    unite = tibble.unite
+    names = tibble.names
+    ncol = tibble.ncol
+
+class GroupedTibble():
+    """
+    A tibble grouped by one or more columns. Created using `tibble.group_by()`.
+
+    The group of each row is computed once and carried along by the grouped verbs.
+    It is only recomputed when a verb modifies the group columns.
+
+    Examples
+    --------
+    >>> df = tp.tibble({'a': range(3), 'b': range(3), 'c': ['a', 'a', 'b']})
+    >>> df.group_by('c').mutate(avg_a = tp.mean('a')).slice_head(1).ungroup()
+    """
+    def __init__(self, df, groups, group_ids = None):
+        self._df = df
+        self._groups = groups
+        self._group_ids = group_ids
+        # Column holding the group ids in the grouped verbs
+        self._group_id = _unused_name(df.names, '_group_id')
+
+    def __dir__(self):
+        _tidypolars_methods = [
+            'arrange', 'count', 'fill', 'filter', 'group_vars', 'head',
+            'mutate', 'names', 'ncol', 'nrow',
+            'slice', 'slice_head', 'slice_tail', 'summarize', 'tail',
+            'ungroup'
+        ]
+        return _tidypolars_methods
+
+    def __repr__(self):
+        """Printing method"""
+        return f"Groups: {', '.join(self._groups)}\n{self._df.__repr__()}"
+
+    def __str__(self):
+        """Printing method"""
+        return self.__repr__()
+
+    def _grouped_frame(self):
+        """Data as a tibble with the group ids attached"""
+        if self._group_ids is None:
+            self._group_ids = _group_ids(self._df.as_polars(), self._groups, self._group_id)
+        group_ids = self._group_ids.alias(self._group_id)
+        return self._df.as_polars().with_columns(group_ids).pipe(from_polars)
+
+    def _regroup(self, df, keep_ids = True):
+        """Build a GroupedTibble from a tibble with the group ids attached"""
+        group_ids = df.pull(self._group_id) if keep_ids else None
+        return GroupedTibble(df.drop(self._group_id), self._groups, group_ids)
+
+    def _sort_groups(self, keep_order):
+        """Sort rows by the groups unless `keep_order` is True"""
+        if keep_order:
+            return self
+        out = self._grouped_frame().as_polars().sort(self._groups, maintain_order = True)
+        return out.pipe(from_polars).pipe(self._regroup)
+
+    def _avoid_names(self, exprs):
+        """Rename the group id column if expressions create a column with the same name"""
+        names = [expr.meta.output_name(raise_if_undetermined = False) for expr in exprs]
+        self._group_id = _unused_name(self._df.names + names, self._group_id)
+
+    def _uses_groups(self, exprs):
+        """Check if expressions could overwrite a group column"""
+        for expr in exprs:
+            name = expr.meta.output_name(raise_if_undetermined = False)
+            if expr.meta.has_multiple_outputs() | (name == None) | (name in self._groups):
+                return True
+        return False
+
+    def arrange(self, *args):
+        """
+        Arrange/sort rows. Does not sort by the groups.
+
+        Parameters
+        ----------
+        *args : str
+            Columns to sort by
+
+        Examples
+        --------
+        >>> df.group_by('x').arrange('y')
+        """
+        return self._grouped_frame().arrange(*args).pipe(self._regroup)
+
+    def count(self, sort = False, name = 'n'):
+        """
+        Count the rows in each group
+
+        Parameters
+        ----------
+        sort : bool
+            Should columns be ordered in descending order by count
+        name : str
+            The name of the new column in the output. If omitted, it will default to "n".
+
+        Examples
+        --------
+        >>> df.group_by('x').count()
+        """
+        out = self.summarize(pl.len().alias(name))
+        if sort == True:
+            out = out.arrange(desc(name))
+        return out
+
+    def fill(self, *args, direction = 'down'):
+        """
+        Fill in missing values with previous or next value within each group
+
+        Parameters
+        ----------
+        *args : str
+            Columns to fill
+        direction : str
+            Direction to fill. One of ['down', 'up', 'downup', 'updown']
+
+        Examples
+        --------
+        >>> df.group_by('groups').fill('a', 'b')
+        """
+        fill_cols = _col_exprs(_as_list(args))
+        out = self._grouped_frame().fill(*fill_cols, direction = direction, _by = self._group_id)
+        return self._regroup(out, keep_ids = not_(self._uses_groups(fill_cols)))
+
+    def filter(self, *args):
+        """
+        Filter rows on one or more conditions evaluated within each group
+
+        Parameters
+        ----------
+        *args : Expr
+            Conditions to filter by
+
+        Examples
+        --------
+        >>> df.group_by('b').filter(col('a') <= tp.mean(col('a')))
+        """
+        return self._grouped_frame().filter(*args, _by = self._group_id).pipe(self._regroup)
+
+    def group_vars(self):
+        """
+        Get the names of the group columns
+
+        Examples
+        --------
+        >>> df.group_by('x').group_vars()
+        """
+        return self._groups
+
+    def head(self, n = 5, *, _keep_order = True):
+        """Alias for `.slice_head()`"""
+        return self.slice_head(n, _keep_order = _keep_order)
+
+    def mutate(self, *args, **kwargs):
+        """
+        Add or modify columns within each group
+
+        Parameters
+        ----------
+        *args : Expr
+            Column expressions to add or modify
+        **kwargs : Expr
+            Column expressions to add or modify
+
+        Examples
+        --------
+        >>> df.group_by('c').mutate(row_num = tp.row_number())
+        """
+        exprs = _as_list(args) + _kwargs_as_exprs(kwargs)
+        self._avoid_names(exprs)
+        out = self._grouped_frame().mutate(*exprs, _by = self._group_id)
+        return self._regroup(out, keep_ids = not_(self._uses_groups(exprs)))
+
+    def slice(self, *args, _keep_order = False):
+        """
+        Grab rows from each group
+
+        Parameters
+        ----------
+        *args : int, list
+            Rows to grab
+        _keep_order : bool
+            If False (the default), output rows are sorted by the groups
+            and rows are returned in the requested order within each group.
+            If True, output rows keep the order of the input,
+            and rows requested more than once are only returned once.
+
+        Examples
+        --------
+        >>> df.group_by('c').slice(0)
+        """
+        out = self._grouped_frame().slice(*args, _by = self._group_id, _keep_order = _keep_order)
+        return self._regroup(out)._sort_groups(_keep_order)
+
+    def slice_head(self, n = 5, *, _keep_order = True):
+        """
+        Grab top rows from each group
+
+        Parameters
+        ----------
+        n : int
+            Number of rows to grab
+        _keep_order : bool
+            If True, output rows keep the order of the input.
+            If False, output rows are sorted by the groups.
+
+        Examples
+        --------
+        >>> df.group_by('c').slice_head(2)
+        """
+        out = self._grouped_frame().slice_head(n, _by = self._group_id)
+        return self._regroup(out)._sort_groups(_keep_order)
+
+    def slice_tail(self, n = 5, *, _keep_order = True):
+        """
+        Grab bottom rows from each group
+
+        Parameters
+        ----------
+        n : int
+            Number of rows to grab
+        _keep_order : bool
+            If True, output rows keep the order of the input.
+            If False, output rows are sorted by the groups.
+
+        Examples
+        --------
+        >>> df.group_by('c').slice_tail(2)
+        """
+        out = self._grouped_frame().slice_tail(n, _by = self._group_id)
+        return self._regroup(out)._sort_groups(_keep_order)
+
+    def summarise(self, *args, **kwargs):
+        """Alias for `.summarize()`"""
+        return self.summarize(*args, **kwargs)
+
+    def summarize(self, *args, **kwargs):
+        """
+        Aggregate data with summary statistics for each group.
+        Returns an ungrouped tibble.
+
+        Parameters
+        ----------
+        *args : Expr
+            Column expressions to add or modify
+        **kwargs : Expr
+            Column expressions to add or modify
+
+        Examples
+        --------
+        >>> df.group_by('c').summarize(avg_a = tp.mean(col('a')))
+        """
+        exprs = _as_list(args) + _kwargs_as_exprs(kwargs)
+        self._avoid_names(exprs)
+        out = (
+            self._grouped_frame().as_polars()
+            .group_by(self._group_id)
+            .agg(pl.col(self._groups).first(), *exprs)
+            .drop(self._group_id)
+        )
+        return out.pipe(from_polars)
+
+    def tail(self, n = 5, *, _keep_order = True):
+        """Alias for `.slice_tail()`"""
+        return self.slice_tail(n, _keep_order = _keep_order)
+
+    def ungroup(self):
+        """
+        Remove the grouping and return a tibble
+
+        Examples
+        --------
+        >>> df.group_by('x').ungroup()
+        """
+        return self._df
+
+    @property
+    def names(self):
+        """Get column names"""
+        return self._df.names
+
+    @property
+    def ncol(self):
+        """Get number of columns"""
+        return self._df.ncol
+
+    @property
+    def nrow(self):
+        """Get number of rows"""
+        return self._df.nrow
+
+class TibbleBuilder():
+    """
+    Accumulate many small data frames and bind them into a tibble once
+
+    Appending only stores a reference to each frame. The frames are concatenated
+    and rechunked a single time by `.finish()`, instead of copying the growing
+    result on every iteration like repeated calls to `.bind_rows()`.
+    Columns are matched by name, missing columns are filled with null,
+    and columns with different types are cast to a common supertype.
+
+    Parameters
+    ----------
+    memory_limit : int
+        Optional. Size in bytes of frames to hold in memory.
+        Once exceeded the held frames are bound and written to an IPC file in `spill_dir`.
+    spill_dir : str
+        Optional. Directory for spilled files. Defaults to a temporary directory.
+
+    Examples
+    --------
+    >>> builder = tp.TibbleBuilder()
+    >>> for i in range(3):
+    ...     builder.append(tp.tibble(x = [i], y = ['a']))
+    >>> builder.finish()
+    """
+    def __init__(self, memory_limit = None, spill_dir = None):
+        self._frames = []
+        self._spilled = []
+        self._size = 0
+        self._memory_limit = memory_limit
+        self._spill_dir = spill_dir
+        self._temp_dir = None
+
+    def __repr__(self):
+        return f"TibbleBuilder: {len(self._frames)} frames in memory, {len(self._spilled)} spilled files"
+
+    def append(self, df):
+        """
+        Add a data frame
+
+        Parameters
+        ----------
+        df : tibble, DataFrame, dict
+            Data frame to add
+
+        Examples
+        --------
+        >>> builder.append(tp.tibble(x = [1], y = ['a']))
+        """
+        if isinstance(df, dict):
+            df = pl.DataFrame(df)
+        elif isinstance(df, tibble):
+            df = df.as_polars()
+        self._frames.append(df)
+        if self._memory_limit != None:
+            self._size += df.estimated_size()
+            if self._size > self._memory_limit:
+                self._spill()
+        return self
+
+    def extend(self, dfs):
+        """
+        Add several data frames
+
+        Parameters
+        ----------
+        dfs : iterable
+            Data frames to add
+
+        Examples
+        --------
+        >>> builder.extend(tp.tibble(x = [i]) for i in range(3))
+        """
+        for df in dfs:
+            self.append(df)
+        return self
+
+    def _spill(self):
+        """Bind the frames held in memory and write them to disk"""
+        spill_dir = self._spill_dir
+        if spill_dir == None:
+            if self._temp_dir == None:
+                self._temp_dir = tempfile.mkdtemp(prefix = 'tidypolars_')
+            spill_dir = self._temp_dir
+        path = os.path.join(spill_dir, f"spill_{id(self)}_{len(self._spilled)}.arrow")
+        pl.concat(self._frames, how = "diagonal_relaxed", rechunk = True).write_ipc(path)
+        self._spilled.append(path)
+        self._frames = []
+        self._size = 0
+
+    def finish(self):
+        """
+        Bind all added data frames into a tibble
+
+        Examples
+        --------
+        >>> builder.finish()
+        """
+        frames = [pl.scan_ipc(path) for path in self._spilled]
+        if len(self._frames) > 0:
+            frames.append(pl.concat(self._frames, how = "diagonal_relaxed").lazy())
+        if len(frames) == 0:
+            return tibble({})
+        out = pl.concat(frames, how = "diagonal_relaxed", rechunk = True).collect()
+        for path in self._spilled:
+            os.remove(path)
+        if self._temp_dir != None:
+            os.rmdir(self._temp_dir)
+            self._temp_dir = None
+        self._frames = []
+        self._spilled = []
+        self._size = 0
+        return out.pipe(from_polars)
 
 def desc(x):
     """Mark a column to order in descending"""
@@ -987,11 +2277,14 @@ def as_tibble(x):
     Parameters
     ----------
     x : [pl.DataFrame, pd.DataFrame, dict]
-        Object to convert to a tibble
+        Object to convert to a tibble.
+        Objects that support the Arrow PyCapsule Interface (`__arrow_c_stream__`),
+        like pyarrow Tables or duckdb results, are imported without copying.
 
     Examples
     --------
     >>> tp.as_tibble(polars_df)
+    >>> tp.as_tibble(arrow_table)
     """
     if isinstance(x, pl.DataFrame):
         out = from_polars(x)
@@ -999,8 +2292,10 @@ def as_tibble(x):
         out = tibble(x)
     elif is_tibble(x):
         out = x
+    elif hasattr(x, '__arrow_c_stream__'):
+        out = from_polars(pl.DataFrame(x))
     else:
-        out = pl.from_dataframe(x)
+        out = from_polars(pl.from_dataframe(x))
     return out
 
 def is_tibble(x):
@@ -1023,21 +2318,24 @@ def from_polars(df):
 
     Parameters
     ----------
-    df : DataFrame
-        pl.DataFrame to convert to a tibble
+    df : DataFrame, LazyFrame
+        pl.DataFrame to convert to a tibble.
+        A pl.LazyFrame is converted to a LazyTibble.
 
     Examples
     --------
     >>> tp.from_polars(df)
     """
-    df = copy.copy(df)
-    df.__class__ = tibble
-    return df
+    if isinstance(df, pl.LazyFrame):
+        return LazyTibble._from_pyldf(df._ldf)
+    return tibble._from_pydf(df._df)
 
 def from_pandas(df):
     """
     Convert from pandas DataFrame to tibble
 
+    If every column is backed by pyarrow (`pd.ArrowDtype`) the data is not copied.
+
     Parameters
     ----------
     df : DataFrame
@@ -1047,14 +2345,15 @@ def from_pandas(df):
     --------
     >>> tp.from_pandas(df)
     """
-    return from_polars(pl.from_pandas(df))
+    arrow_backed = all(str(dtype).endswith('[pyarrow]') for dtype in df.dtypes)
+    return from_polars(pl.from_pandas(df, rechunk = not_(arrow_backed)))
 
 _allowed_methods = [
     'dtypes', 'frame_equal',
     'get_columns', 'lazy', 'pipe'
 ]
 
-_polars_methods = [
+_polars_methods = frozenset([
     'apply',
     'columns',
     'describe',
@@ -1115,4 +2414,15 @@ _polars_methods = [
     'with_columns',
     'with_column_renamed',
     'with_columns'
-]
+])
+
+for _method in _polars_methods:
+    setattr(tibble, _method, _HiddenMethod(_method))
+    if hasattr(pl.LazyFrame, _method):
+        setattr(LazyTibble, _method, _HiddenMethod(_method, pl.LazyFrame))
+
+# tibble methods that need the data in memory
+_eager_methods = ['bind_cols', 'group_by', 'pivot_wider', 'pull']
+
+for _method in _eager_methods:
+    setattr(LazyTibble, _method, _EagerMethod(_method))
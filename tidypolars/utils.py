@@ -101,16 +101,180 @@ def _col_expr(x):
     else:
        raise ValueError("Invalid input for column selection") 
 
+def _names(df):
+    """Get the column names of a DataFrame or LazyFrame"""
+    if isinstance(df, pl.DataFrame):
+        # Faster than building the full schema
+        return df.columns
+    return df.collect_schema().names()
+
+def _select_names(df, args):
+    """
+    Get the names of the columns selected by `args` using only the schema of `df`.
+    No data is read or copied, so this also works on lazy frames.
+    """
+    if _is_list(args) | _is_tuple(args) | _is_series(args):
+        args = _as_list(args)
+    else:
+        args = [args]
+    if all(_is_string(arg) for arg in args):
+        if set(args) <= set(_names(df)):
+            return args
+    # Resolving the schema of a lazy query doesn't run it
+    return df.lazy().select(_col_exprs(args)).collect_schema().names()
+
 def _repeat(x, times):
     if not_(_is_list(x)):
         x = [x]
     return x * times
 
+# Integer types and their ranges from smallest to largest, in pairs of the same size
+_int_types = [
+    (pl.Int8, -2**7, 2**7 - 1), (pl.UInt8, 0, 2**8 - 1),
+    (pl.Int16, -2**15, 2**15 - 1), (pl.UInt16, 0, 2**16 - 1),
+    (pl.Int32, -2**31, 2**31 - 1), (pl.UInt32, 0, 2**32 - 1),
+    (pl.Int64, -2**63, 2**63 - 1), (pl.UInt64, 0, 2**64 - 1)
+]
+
+def _compact_types(df, categorical_ratio):
+    """
+    Get the smallest lossless type of each column that can be shrunk.
+    The column statistics are computed in a single pass.
+    """
+    # Integer types without a smaller type to shrink to (e.g. Int128) are skipped
+    sizes = [int_type for int_type, _, _ in _int_types]
+    stats = []
+    for name, dtype in df.schema.items():
+        col = pl.col(name)
+        if dtype in sizes:
+            stats += [col.min().alias(f"{name}_min"), col.max().alias(f"{name}_max")]
+        elif dtype == pl.Float64:
+            round_trip = (col.cast(pl.Float32).cast(pl.Float64) == col) | col.is_nan()
+            stats.append(round_trip.all().alias(f"{name}_float32"))
+        elif dtype == pl.Utf8:
+            stats.append(col.n_unique().alias(f"{name}_n_unique"))
+    if len(stats) == 0:
+        return {}
+    stats = df.select(stats).row(0, named = True)
+    out = {}
+    for name, dtype in df.schema.items():
+        if dtype in sizes:
+            col_min, col_max = stats[f"{name}_min"], stats[f"{name}_max"]
+            if col_min == None:
+                continue
+            # Keep the signedness so subtracting from an unsigned column can't wrap around
+            for int_type, type_min, type_max in _int_types:
+                if int_type.is_signed_integer() != dtype.is_signed_integer():
+                    continue
+                if (type_min <= col_min) & (col_max <= type_max):
+                    break
+            if sizes.index(int_type) // 2 < sizes.index(dtype) // 2:
+                out[name] = int_type
+        elif dtype == pl.Float64:
+            if stats[f"{name}_float32"]:
+                out[name] = pl.Float32
+        elif dtype == pl.Utf8:
+            if stats[f"{name}_n_unique"] <= categorical_ratio * df.height:
+                out[name] = pl.Categorical
+    return out
+
+def _filter_group_rows(df, predicate, by, keep_order = True):
+    """
+    Filter rows using a `predicate` evaluated within each group.
+    If `keep_order` is False the output is sorted by the groups.
+    """
+    out = df.filter(predicate.over(by))
+    if not_(keep_order):
+        out = out.sort(by, maintain_order = True)
+    return out
+
+def _gather_group_rows(df, rows, by):
+    """
+    Get `rows` of each group in the requested order, with the output sorted by the groups.
+    Rows that are out of bounds for a group are skipped.
+    """
+    rows = pl.lit(pl.Series(rows, dtype = pl.Int64))
+    group_len = pl.len().cast(pl.Int64)
+    rows = rows.filter((rows < group_len) & (rows >= -group_len))
+    out = df.select(pl.all().gather(rows).over(by, mapping_strategy = 'explode'))
+    return out.sort(by, maintain_order = True)
+
+def _group_ids(df, by, name):
+    """
+    Get the group each row belongs to as a Series called `name`.
+    Ids are unique per group, but not consecutive.
+    """
+    row_index = pl.int_range(pl.len()).alias(name)
+    return (
+        df.select(row_index, *by)
+        .select(pl.col(name).first().over(by))
+        .get_column(name)
+    )
+
+def _is_sorted(df, name):
+    """Check if column `name` is sorted. Lazy frames are assumed to be unsorted."""
+    return isinstance(df, pl.DataFrame) and df.get_column(name).is_sorted()
+
+def _match_frame_type(df, other):
+    """Make `other` lazy if `df` is lazy so the two frames can be joined"""
+    if isinstance(df, pl.LazyFrame) & isinstance(other, pl.DataFrame):
+        other = other.lazy()
+    return other
+
 def _mutate_cols(df, exprs):
-    for expr in exprs:
-        df = df.with_columns(expr)
+    for batch in _mutate_batches(exprs):
+        df = df.with_columns(batch)
     return df
 
+def _mutate_batches(exprs):
+    """
+    Split mutate expressions into batches that can each be run in a single
+    `with_columns()`, so polars can evaluate a batch in parallel.
+
+    A new batch is only started when an expression uses or overwrites a column
+    created earlier in the current batch, which keeps dplyr's left-to-right semantics.
+    Expressions with unknown inputs or outputs (e.g. `pl.all()` or selectors)
+    are run on their own.
+    """
+    batches = []
+    batch = []
+    batch_names = set()
+    for expr in exprs:
+        if _is_expr(expr) and not_(expr.meta.has_multiple_outputs()):
+            name = expr.meta.output_name(raise_if_undetermined = False)
+        else:
+            name = None
+        if name != None:
+            inputs = set(expr.meta.root_names())
+            if (name in batch_names) | (len(inputs & batch_names) > 0):
+                batches.append(batch)
+                batch = []
+                batch_names = set()
+            batch.append(expr)
+            batch_names.add(name)
+        else:
+            if len(batch) > 0:
+                batches.append(batch)
+            batches.append([expr])
+            batch = []
+            batch_names = set()
+    if len(batch) > 0:
+        batches.append(batch)
+    return batches
+
+def _mutate_cols_by(df, exprs, by):
+    """
+    Grouped mutate that evaluates each expression as a window over `by`.
+    Row order is kept.
+    """
+    return _mutate_cols(df, [expr.over(by) for expr in exprs])
+
+def _unused_name(names, name):
+    """Add underscores to `name` until it isn't in `names`"""
+    while name in names:
+        name = f"_{name}"
+    return name
+
 def _str_to_lit(x):
     if _is_string(x):
         x = pl.lit(x)